@@ -4,11 +4,15 @@ Flask API for resume parsing with OCR capabilities
 """
 
 import os
+import uuid
+import shutil
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
-from modules.resume_parser import ResumeParser
+from modules.resume_parser import ResumeParser, init_parse_worker
 
 # Configure logging
 logging.basicConfig(
@@ -25,16 +29,41 @@ CORS(app)
 UPLOAD_FOLDER = 'temp_uploads'
 ALLOWED_EXTENSIONS = {'pdf'}
 PORT = 3001
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+PDF_HEADER_SCAN_BYTES = 1024  # PDF readers accept the %PDF- header anywhere in the first 1KB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB copy buffer (Werkzeug defaults to 16KB)
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+
+# CPU-bound parsing/OCR runs in worker processes so it never holds this
+# interpreter's GIL while other requests are being served. Each worker OCRs its
+# own resume inline - a per-worker OCR pool would start cpu_count² Tesseracts
+app.config['PARSE_POOL'] = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_parse_worker)
+
+def _parse_job(file_path):
+    """Parse a saved resume in a pool worker; returns (parsed_data, text_length)"""
+    parser = ResumeParser(file_path)
+    parsed_data = parser.parse()
+    return parsed_data, len(parser.text_content)
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def is_pdf_file(file_path):
+    """True if the saved upload carries a PDF header"""
+    with open(file_path, 'rb') as f:
+        return b'%PDF-' in f.read(PDF_HEADER_SCAN_BYTES)
+
+def save_upload_stream(stream, file_path):
+    """Copy an upload stream to disk in UPLOAD_CHUNK_SIZE pieces"""
+    with open(file_path, 'wb') as out:
+        shutil.copyfileobj(stream, out, length=UPLOAD_CHUNK_SIZE)
+
 def check_system_dependencies():
-    """Check if required system dependencies are installed"""
+    """Check if required system dependencies are installed; returns True when all are present"""
     logger.info("🔍 Checking system dependencies...")
 
     missing_deps = []
@@ -47,58 +76,90 @@ def check_system_dependencies():
     except Exception:
         missing_deps.append("Tesseract OCR")
 
-    # Check Poppler (for pdf2image)
-    try:
-        from pdf2image import convert_from_path
-        logger.info("✅ Poppler/pdf2image found")
-    except Exception:
-        missing_deps.append("Poppler (for PDF conversion)")
-
     if missing_deps:
         logger.warning(f"⚠️ Missing dependencies: {', '.join(missing_deps)}")
-        logger.warning("Install with: brew install tesseract poppler (macOS) or apt-get install tesseract-ocr poppler-utils (Ubuntu)")
+        logger.warning("Install with: brew install tesseract (macOS) or apt-get install tesseract-ocr (Ubuntu)")
     else:
         logger.info("✅ All system dependencies found")
 
+    return not missing_deps
+
+# Probe once at startup - get_tesseract_version() spawns the tesseract binary
+_DEPS_OK = check_system_dependencies()
+
+def _too_large_response():
+    """JSON error returned for request bodies over MAX_CONTENT_LENGTH"""
+    return jsonify({
+        'success': False,
+        'error': f'File too large (max: {MAX_FILE_SIZE} bytes)'
+    }), 413
+
+@app.before_request
+def reject_oversize_request():
+    """Turn away oversize uploads by their Content-Length before any of the body is read"""
+    content_length = request.content_length
+    if content_length is not None and content_length > app.config['MAX_CONTENT_LENGTH']:
+        logger.warning(f"⚠️ Rejected {content_length}-byte request to {request.path}")
+        return _too_large_response()
+
+@app.errorhandler(413)
+def request_entity_too_large(error):
+    """Werkzeug's 413 for multipart bodies without a Content-Length that overrun the limit"""
+    return _too_large_response()
+
 @app.route('/resume/parse_api', methods=['POST'])
 def parse_resume():
-    """Parse uploaded resume PDF with OCR fallback"""
+    """Parse uploaded resume PDF with OCR fallback
 
-    if 'resume_file' not in request.files:
-        return jsonify({
-            'success': False,
-            'error': 'No file uploaded'
-        }), 400
-
-    file = request.files['resume_file']
+    Accepts multipart/form-data with a 'resume_file' field, or a raw
+    application/pdf body which skips multipart parsing entirely.
+    """
 
-    if file.filename == '':
-        return jsonify({
-            'success': False,
-            'error': 'No file selected'
-        }), 400
+    if request.mimetype == 'application/pdf':
+        # Raw PDF body - stream it straight to disk
+        upload_stream = request.stream
+        filename = f"{uuid.uuid4().hex}.pdf"
+    else:
+        if 'resume_file' not in request.files:
+            return jsonify({
+                'success': False,
+                'error': 'No file uploaded'
+            }), 400
 
-    if not allowed_file(file.filename):
-        return jsonify({
-            'success': False,
-            'error': 'Only PDF files are allowed'
-        }), 400
+        file = request.files['resume_file']
 
-    try:
-        # Save uploaded file temporarily
         if not file.filename:
             return jsonify({
                 'success': False,
-                'error': 'No filename provided'
+                'error': 'No file selected'
+            }), 400
+
+        if not allowed_file(file.filename):
+            return jsonify({
+                'success': False,
+                'error': 'Only PDF files are allowed'
             }), 400
 
+        upload_stream = file.stream
         filename = secure_filename(file.filename)
+
+    try:
+        # Save uploaded file temporarily
         file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"temp_{filename}")
-        file.save(file_path)
+        save_upload_stream(upload_stream, file_path)
+
+        # A raw body is only labelled application/pdf and skipped allowed_file; check the
+        # bytes themselves before handing them to the parser
+        if not is_pdf_file(file_path):
+            os.remove(file_path)
+            return jsonify({
+                'success': False,
+                'error': 'Only PDF files are allowed'
+            }), 400
 
-        # Parse using modular parser
-        parser = ResumeParser(file_path)
-        parsed_data = parser.parse()
+        # Parse using modular parser in the process pool
+        future = app.config['PARSE_POOL'].submit(_parse_job, file_path)
+        parsed_data, text_length = future.result()
 
         # Clean up temp file
         os.remove(file_path)
@@ -107,9 +168,15 @@ def parse_resume():
             'success': True,
             'data': parsed_data,
             'message': 'Resume parsed successfully (with OCR fallback)',
-            'text_length': len(parser.text_content)
+            'text_length': text_length
         })
 
+    except RequestEntityTooLarge:
+        # A body without Content-Length ran past MAX_CONTENT_LENGTH while streaming to disk
+        if 'file_path' in locals() and os.path.exists(file_path):
+            os.remove(file_path)
+        return _too_large_response()
+
     except Exception as e:
         # Clean up temp file if it exists
         if 'file_path' in locals() and os.path.exists(file_path):
@@ -126,23 +193,13 @@ def parse_resume():
 def health_check():
     """Health check endpoint with system info"""
 
-    # Check system dependencies
-    deps_ok = True
-    try:
-        import pytesseract
-        pytesseract.get_tesseract_version()
-        from pdf2image import convert_from_path
-    except Exception:
-        deps_ok = False
-
     return jsonify({
         'status': 'healthy',
         'message': 'Enhanced Resume Auto-Fill API is running',
         'features': {
             'pdf_text_extraction': True,
-            'ocr_fallback': deps_ok,
-            'tesseract_available': deps_ok,
-            'poppler_available': deps_ok
+            'ocr_fallback': _DEPS_OK,
+            'tesseract_available': _DEPS_OK
         },
         'port': PORT
     })
@@ -153,11 +210,11 @@ if __name__ == '__main__':
     print("🔗 Chrome extension should point to: http://localhost:3001/resume/parse_api")
     print("⚡ Features: PDF text extraction + OCR fallback + Advanced parsing")
 
-    # Check dependencies
-    check_system_dependencies()
-
+    # Flask's built-in server is for local use; production runs under gunicorn (see README).
+    # The debug reloader would start the server, and its parse pool, twice
     app.run(
         host='0.0.0.0',
         port=PORT,
-        debug=True
+        debug=False,
+        threaded=True
     )
@@ -5,19 +5,390 @@ Handles PDF parsing with OCR fallback and data extraction
 
 import os
 import re
+import copy
+import hashlib
 import logging
-from io import BytesIO
-import PyPDF2
+import tempfile
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from io import BytesIO, StringIO
+import pymupdf
 import pytesseract
 from PIL import Image
-from pdf2image import convert_from_path
+
+# Pages and resumes are OCR'd in parallel worker processes, so each Tesseract sticks to
+# one OpenMP thread. OpenMP reads this once, when libtesseract is loaded (tesserocr) or
+# launched (pytesseract), so it has to be set before either - workers inherit it
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# libtesseract bindings keep the language model loaded in-process
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+# OpenCV is optional; without it pages are only converted to grayscale
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+# LSTM engine; page segmentation stays automatic (psm 3) so multi-column resumes keep their column order
+TESSERACT_CONFIG = '--oem 1 --psm 3'
+
+# 200 dpi is enough for standard resume fonts; pages that OCR to (almost)
+# nothing are retried once at 300 dpi
+OCR_DPI = 200
+OCR_RETRY_DPI = 300
+MIN_PAGE_TEXT_CHARS = 50
+
+# Each OCR worker runs a single-threaded Tesseract (OMP_THREAD_LIMIT above), so one per core
+OCR_MAX_WORKERS = os.cpu_count() or 1
+
+ADDRESS_SCAN_LINES = 20  # Addresses sit in the resume header
+MIN_FONT_HEADERS = 2  # Trust font-based section headers only if this many look like sections
+
+# Parsed results kept per process, keyed by OCR dpi and a hash of the PDF bytes
+PARSE_CACHE_SIZE = 256
+
+# Output limits; sections stop collecting once they are reached
+SUMMARY_MAX_LINES = 3
+MAX_EXPERIENCE = 5
+MAX_PROJECTS = 5
+
+_BOLD_FLAG = 1 << 4  # PyMuPDF span flag for bold text
+# "dict" output embeds every image's bytes by default; only text and fonts are needed
+_TEXT_DICT_FLAGS = pymupdf.TEXTFLAGS_DICT & ~pymupdf.TEXT_PRESERVE_IMAGES
+
+# Regexes are compiled once at import and shared by every parse
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+_EMAIL_VALIDATE_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+_PHONE_CLEAN_RE = re.compile(r'[^\d\+\-\(\)\s]')
+
+# Every contact field in one pass over the document; alternatives are tried in
+# this order at each position and the outer group name comes back as lastgroup
+_CONTACT_RE = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in (
+    ('email', _EMAIL_PATTERN),
+    ('phone', r'\b(?:\+?1[-.\s]?)?\(?(?P<area>[0-9]{3})\)?[-.\s]?(?P<exchange>[0-9]{3})[-.\s]?(?P<line>[0-9]{4})\b'),
+    ('phone_intl', r'\b\d{3}[-.]?\d{4}[-.]?\d{4}\b'),  # 3-4-4 grouping, e.g. Chinese mobiles
+    ('linkedin_url', r'https?://[\w.\-]*?(?P<linkedin_path>linkedin\.com/in/[\w\-]+)'),
+    ('website', r'https?://[\w\.\-]+\.[a-z]{2,}'),
+    ('linkedin', r'linkedin\.com/in/[\w\-]+'),
+)), re.IGNORECASE)
+_NAME_EXCLUDE_KINDS = frozenset({'email', 'phone', 'phone_intl'})  # Lines with these can't be the name
+_JOB_TITLE_RE = re.compile(r'\b(manager|director|engineer|developer|analyst|coordinator|assistant|specialist)\b')
+_DATE_RANGE_RE = re.compile(r'\b(20\d{2}|19\d{2})\s*[-–]\s*(20\d{2}|19\d{2}|present)\b', re.IGNORECASE)
+_BULLETS = ('-', '•', '*', '·', '◦')  # Line prefixes that mark a bullet point
+_YEAR_RE = re.compile(r'\b(?:20\d{2}|19\d{2})\b')
+_SKILL_SPLIT_RE = re.compile(r'[,•·\-\n|/]')
+
+TECH_SKILLS = [
+    'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
+    'react', 'vue', 'angular', 'node', 'express', 'django', 'flask', 'rails',
+    'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'matplotlib',
+    'linux', 'windows', 'macos', 'unix', 'bash', 'powershell'
+]
+
+SOFT_SKILLS = [
+    'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
+    'creative', 'adaptable', 'organized', 'detail-oriented', 'time management',
+    'project management', 'customer service', 'presentation', 'negotiation'
+]
+
+LANGUAGES = [
+    'english', 'spanish', 'french', 'german', 'italian', 'portuguese', 'chinese',
+    'japanese', 'korean', 'arabic', 'russian', 'hindi', 'mandarin', 'cantonese'
+]
+
+def _keyword_re(*keywords):
+    """Compile keywords into one alternation that matches like `any(kw in line_lower ...)`"""
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+# Section headers, and one shared list of headings that end whichever section is
+# open - a section never ends on its own heading. Summary/objective open a resume,
+# so they never need to end anything
+_EXPERIENCE_HDR = frozenset({'experience', 'employment', 'work history'})
+_EDU_HDR = frozenset({'education', 'academic'})
+_SKILLS_HDR = frozenset({'skills', 'technologies', 'tools'})
+_SUMMARY_HDR = frozenset({'summary', 'objective', 'profile', 'about'})
+_PROJECTS_HDR = frozenset({'projects', 'portfolio'})
+_LANGUAGES_HDR = frozenset({'language'})
+_CERT_HDR = frozenset({'certifications', 'certificates', 'licenses'})
+_CERT_KEYWORDS = frozenset({'certified', 'certificate', 'license'})
+
+_SECTION_STOP = frozenset({
+    'experience', 'employment', 'work history', 'education', 'skills', 'projects',
+    'languages', 'certifications'
+})
+_EXPERIENCE_END = _SECTION_STOP - _EXPERIENCE_HDR
+_EDU_END = _SECTION_STOP - _EDU_HDR
+_SKILLS_END = _SECTION_STOP - _SKILLS_HDR
+_SUMMARY_END = _SECTION_STOP - _SUMMARY_HDR
+_PROJECTS_END = _SECTION_STOP - _PROJECTS_HDR
+_LANGUAGES_END = _SECTION_STOP - {'languages'}
+_CERT_END = _SECTION_STOP - _CERT_HDR
+
+_SECTION_KEYWORDS = frozenset().union(
+    _EXPERIENCE_HDR, _EDU_HDR, _SKILLS_HDR, _SUMMARY_HDR, _PROJECTS_HDR, _LANGUAGES_HDR,
+    _CERT_HDR, _CERT_KEYWORDS, _SECTION_STOP
+)
+# A lookahead finds the longest keyword starting at every word start, overlaps included;
+# the closure adds the shorter keywords it contains ('languages' -> 'language').
+# Keywords must begin a word ('work' not in 'network') but may be inflected ('educational')
+_SECTION_KEYWORD_RE = re.compile(
+    r'(?<!\w)(?=(' + '|'.join(re.escape(kw) for kw in sorted(_SECTION_KEYWORDS, key=len, reverse=True)) + '))'
+)
+_SECTION_KEYWORD_CLOSURE = {
+    kw: frozenset(other for other in _SECTION_KEYWORDS if other in kw) for kw in _SECTION_KEYWORDS
+}
+
+def _section_keywords(line_lower):
+    """Every section keyword that occurs as a substring of line_lower, from one scan"""
+    found = set()
+    for kw in _SECTION_KEYWORD_RE.findall(line_lower):
+        found |= _SECTION_KEYWORD_CLOSURE[kw]
+    return found
+
+_ANY_SECTION_RE = _keyword_re(
+    'experience', 'employment', 'work history', 'education', 'academic', 'skills', 'technologies',
+    'summary', 'objective', 'profile', 'projects', 'portfolio', 'language', 'certifications'
+)
+
+# Line classifiers
+# Street keyword (any case) or a case-sensitive 'City, ST 12345'
+_ADDRESS_RE = re.compile(
+    r'(?i:\b(?:street|ave(?:nue)?|r(?:oa)?d|dr(?:ive)?|lane|ln|blvd|boulevard)\b)'
+    r'|\b[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}'
+)
+_LANGUAGE_RE = re.compile(r'\b(' + '|'.join(LANGUAGES) + r')\b')
+_FLUENT_RE = _keyword_re('native', 'fluent')
+_BASIC_RE = _keyword_re('basic', 'beginner')
+
+# Single-word classifiers are checked against each line's token set, so short
+# keywords like 'ma' or 'inc' no longer fire inside 'management' or 'including'
+_WORD_RE = re.compile(r'\w+')
+_COMPANY_TOKENS = frozenset({'inc', 'corp', 'corporation', 'llc', 'company', 'ltd'})
+_ACADEMIC_TOKENS = frozenset({'university', 'college'})
+_INSTITUTION_TOKENS = frozenset({'university', 'college', 'institute'})
+_WORK_INDICATOR_TOKENS = frozenset({'instructor', 'teacher', 'manager', 'director', 'engineer', 'developer'})
+_DEGREE_TOKENS = frozenset({
+    'bachelor', 'bachelors', 'master', 'masters', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree'
+})
+
+# Tech skills match as whole tokens so 'java' doesn't fire inside 'javascript';
+# lookarounds instead of \b because of entries like 'c++' and 'c#'
+_TECH_SKILLS_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(s) for s in sorted(TECH_SKILLS, key=len, reverse=True)) + r')(?!\w)',
+    re.IGNORECASE
+)
+
+# Single-word skills are looked up in the document's token set; only the few
+# entries with punctuation or spaces need a scan of the text
+_TECH_SKILL_WORDS = frozenset(skill for skill in TECH_SKILLS if _WORD_RE.fullmatch(skill))
+_TECH_SKILLS_COMPOUND_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(s) for s in TECH_SKILLS if s not in _TECH_SKILL_WORDS) + r')(?!\w)'
+)
+_SOFT_SKILL_WORDS = frozenset(skill for skill in SOFT_SKILLS if _WORD_RE.fullmatch(skill))
+_SOFT_SKILL_PHRASES = [skill for skill in SOFT_SKILLS if skill not in _SOFT_SKILL_WORDS]
+
+def _find_skills(text_lower, tokens):
+    """Return the (tech, soft) skills in text_lower, given its set of word tokens"""
+    tech = (tokens & _TECH_SKILL_WORDS) | set(_TECH_SKILLS_COMPOUND_RE.findall(text_lower))
+    soft = (tokens & _SOFT_SKILL_WORDS) | {phrase for phrase in _SOFT_SKILL_PHRASES if phrase in text_lower}
+    return tech, soft
+
+# Section entries are built as slotted dataclasses while parsing and converted
+# to plain dicts only when stored in parsed_data, which is returned as JSON
+class _Entry:
+    __slots__ = ()
+
+    def to_dict(self):
+        """Return the entry as a dict, fields in declaration order"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+@dataclass(slots=True)
+class JobEntry(_Entry):
+    title: str = ''
+    company: str = ''
+    dates: str = ''
+    description: str = ''
+
+@dataclass(slots=True)
+class EduEntry(_Entry):
+    school: str = ''
+    degree: str = ''
+    year: str = ''
+
+@dataclass(slots=True)
+class ProjectEntry(_Entry):
+    name: str = ''
+    description: str = ''
+    technologies: list = field(default_factory=list)
+
+@dataclass(slots=True)
+class LanguageEntry(_Entry):
+    language: str = ''
+    proficiency: str = 'conversational'
+
+@dataclass(slots=True)
+class CertEntry(_Entry):
+    name: str = ''
+    issuer: str = ''
+    year: str = ''
 
 logger = logging.getLogger(__name__)
 
+# One Tesseract API per process, created on first use. Nothing is created at
+# import time, so preloading this module before a server forks is safe
+_tess_api = None
+_tess_api_lock = threading.Lock()
+
+# Long-lived OCR workers: each keeps its Tesseract model loaded across resumes
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+def _get_tess_api():
+    global _tess_api
+    with _tess_api_lock:
+        if _tess_api is None:
+            _tess_api = PyTessBaseAPI(lang='eng', psm=PSM.AUTO, oem=OEM.LSTM_ONLY)
+        return _tess_api
+
+class _InlineExecutor:
+    """Runs submitted calls immediately in this process"""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+def _get_ocr_pool():
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(max_workers=OCR_MAX_WORKERS)
+        return _ocr_pool
+
+def _discard_ocr_pool(pool):
+    """Drop a pool whose worker died, so the next _get_ocr_pool() starts a fresh one"""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is pool:
+            _ocr_pool = None
+    pool.shutdown(wait=False)
+
+# LRU of (dpi, content hash) -> (text_content, parsed_data); repeat uploads skip extraction and OCR
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+def _cache_get(key):
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is None:
+            return None
+        _parse_cache.move_to_end(key)
+    return copy.deepcopy(entry)
+
+def _cache_put(key, text_content, parsed_data):
+    entry = (text_content, copy.deepcopy(parsed_data))
+    with _parse_cache_lock:
+        _parse_cache[key] = entry
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+def init_parse_worker():
+    """Initializer for pools whose workers each parse whole resumes (one per core): OCR
+    inline in the worker instead of starting a nested OCR pool from it"""
+    global _ocr_pool
+    _ocr_pool = _InlineExecutor()
+
+def _parse_one(file_path):
+    return ResumeParser(file_path).parse()
+
+def _preprocess_for_ocr(image):
+    """Grayscale + adaptive Gaussian threshold; a 1-bit page is cheaper for Tesseract to scan"""
+    gray = image.convert('L')
+    if cv2 is None:
+        return gray
+
+    binary = cv2.adaptiveThreshold(
+        np.asarray(gray), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+    )
+    return Image.fromarray(binary)
+
+def _ocr_page(png_bytes):
+    """OCR a single rendered page (module-level so it can run in a worker process)"""
+    image = _preprocess_for_ocr(Image.open(BytesIO(png_bytes)))
+
+    if PyTessBaseAPI is not None:
+        api = _get_tess_api()
+        api.SetImage(image)
+        return api.GetUTF8Text()
+
+    # Fallback: pytesseract forks the tesseract CLI for every page
+    return pytesseract.image_to_string(image, lang='eng', config=TESSERACT_CONFIG)
+
+def _ocr_batch(pages_png):
+    """OCR several rendered pages with one tesseract run over an image-list file"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for i, png_bytes in enumerate(pages_png):
+            path = os.path.join(tmp_dir, f"page_{i}.png")
+            _preprocess_for_ocr(Image.open(BytesIO(png_bytes))).save(path)
+            paths.append(path)
+
+        list_path = os.path.join(tmp_dir, "pages.txt")
+        with open(list_path, 'w') as f:
+            f.write('\n'.join(paths) + '\n')
+
+        text = pytesseract.image_to_string(list_path, lang='eng', config=TESSERACT_CONFIG)
+
+    # Tesseract ends every page with a form feed
+    page_texts = text.split('\f')
+    if len(page_texts) < len(pages_png):
+        raise ValueError(f"expected {len(pages_png)} pages, got {len(page_texts)}")
+    return page_texts[:len(pages_png)]
+
+def _join_pages(page_texts):
+    """Concatenate non-empty pages, newline-separated, into a single string"""
+    buf = StringIO()
+    for text in page_texts:
+        if text.strip():
+            if buf.tell():
+                buf.write('\n')
+            buf.write(text)
+    return buf.getvalue()
+
+
 class ResumeParser:
-    def __init__(self, file_path):
+    def __init__(self, file_path, dpi=OCR_DPI):
         self.file_path = file_path
+        self.dpi = dpi
         self.text_content = ""
+        self._pdf_bytes = None
+        self._page_texts = []
+        self._textless_pages = []
+        self._extraction_ok = True  # Cleared when text extraction or OCR hits an error
+        self._font_lines = []  # (page number, text, font size, bold) from the embedded text layer
+        self._lines = ()
+        self._line_starts = ()
+        self._lines_lower = ()
+        self._line_tokens = ()
+        self._header_mask = []
+        self._text_lower = ""
+        self._tokenized_text = None  # text_content the fields above were built from
         self.parsed_data = {
             'personal': {},
             'summary': '',
@@ -30,333 +401,520 @@ class ResumeParser:
             'certifications': []
         }
 
+    @classmethod
+    def parse_many(cls, file_paths, workers=None):
+        """Parse several resumes in parallel, one per worker process; results follow file_paths order"""
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=init_parse_worker) as executor:
+            return list(executor.map(_parse_one, file_paths))
+
     def parse(self):
         """Main parsing method with OCR fallback"""
-        logger.info(f"🔍 Starting enhanced resume parsing for: {self.file_path}")
+        logger.info("🔍 Starting enhanced resume parsing for: %s", self.file_path)
+
+        try:
+            # OCR output depends on the render resolution, so it is part of the key
+            cache_key = (self.dpi, hashlib.blake2b(self._read_pdf(), digest_size=16).digest())
+        except OSError:
+            cache_key = None  # Extraction below logs the failure
+
+        cached = _cache_get(cache_key) if cache_key else None
+        if cached:
+            self.text_content, self.parsed_data = cached
+            logger.info("♻️ Same PDF parsed before, reusing result")
+            return self.parsed_data
 
         # Step 1: Extract text from PDF
         self.extract_text_from_pdf()
 
-        # Step 2: OCR fallback if text is minimal
-        if len(self.text_content.strip()) < 100:
-            logger.info("📸 Text content minimal, trying OCR...")
-            self.extract_text_with_ocr()
+        # Step 2: OCR fallback, only for pages without embedded text
+        if self._textless_pages:
+            logger.info("📸 %d page(s) without a text layer, trying OCR...", len(self._textless_pages))
+            self.extract_text_with_ocr(self._textless_pages)
 
         # Step 3: Parse structured data
         if self.text_content.strip():
+            self._tokenize()
             self.parse_personal_information()
-            self.parse_summary()
-            self.parse_experience()
-            self.parse_education()
-            self.parse_skills()
-            self.parse_projects()
-            self.parse_languages()
-            self.parse_certifications()
+            self._parse_sections()
             self.clean_and_validate_data()
 
-        logger.info(f"✅ Parsing complete. Text length: {len(self.text_content)}")
+        # A failed extraction or OCR run may be transient; only cache complete results
+        if cache_key and self._extraction_ok and self.text_content.strip():
+            _cache_put(cache_key, self.text_content, self.parsed_data)
+
+        logger.info("✅ Parsing complete. Text length: %d", len(self.text_content))
         return self.parsed_data
 
+    def _tokenize(self):
+        """Split and lowercase the final text once; every parse_* method reads these"""
+        # Lowercasing never adds or removes newlines, so the lower-cased copy splits
+        # into the same lines and a single .lower() over the whole text covers both
+        self._tokenized_text = self.text_content
+        self._text_lower = self.text_content.lower()
+        lines, lines_lower, line_starts = [], [], []
+        offset = 0
+        for raw_line, raw_lower in zip(self.text_content.split('\n'), self._text_lower.split('\n')):
+            line = raw_line.strip()
+            if line:
+                lines.append(line)
+                lines_lower.append(raw_lower.strip())
+                line_starts.append(offset)
+            offset += len(raw_line) + 1
+
+        # Shared read-only by every parser
+        self._lines = tuple(lines)
+        self._lines_lower = tuple(lines_lower)
+        self._line_starts = tuple(line_starts)  # Offset of each kept line in text_content
+        self._line_tokens = tuple(frozenset(_WORD_RE.findall(line)) for line in lines_lower)
+        self._header_mask = self._section_header_mask()
+
+    def _ensure_tokenized(self):
+        """Tokenize text_content unless that was already done for this exact text"""
+        if self._tokenized_text is not self.text_content:
+            self._tokenize()
+
+    def _section_header_mask(self):
+        """Flag lines set larger or bolder than body text; all True when the fonts don't tell us"""
+        if not self._font_lines:
+            return [True] * len(self._lines)
+
+        sizes = sorted(size for _, _, size, _ in self._font_lines)
+        body_size = sizes[len(sizes) // 2]
+        headers = {
+            text.lower() for _, text, size, bold in self._font_lines
+            if bold or size > body_size
+        }
+
+        # Only gate on fonts if the emphasised lines include real section headings
+        if sum(1 for text in headers if _ANY_SECTION_RE.search(text)) < MIN_FONT_HEADERS:
+            return [True] * len(self._lines)
+        return [line_lower in headers for line_lower in self._lines_lower]
+
+    def _largest_first_page_line(self):
+        """Text of the largest-font line on the first page, or None without font info"""
+        first_page = [(size, text) for page, text, size, _ in self._font_lines if page == 0]
+        if not first_page:
+            return None
+        return max(first_page, key=lambda item: item[0])[1]
+
+    def _read_pdf(self):
+        """The PDF's bytes; the file is read from disk only once per parse"""
+        if self._pdf_bytes is None:
+            with open(self.file_path, 'rb') as f:
+                self._pdf_bytes = f.read()
+        return self._pdf_bytes
+
+    def _open_pdf(self):
+        return pymupdf.open(stream=self._read_pdf(), filetype="pdf")
+
     def extract_text_from_pdf(self):
-        """Extract text using PyPDF2"""
+        """Extract text using PyMuPDF, keeping each line's font size for layout heuristics"""
         try:
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text_parts = []
-
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            text_parts.append(page_text)
-                            logger.info(f"📄 Extracted text from page {page_num + 1}: {len(page_text)} chars")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Failed to extract text from page {page_num + 1}: {e}")
-
-                self.text_content = '\n'.join(text_parts)
-                logger.info(f"✅ PDF text extraction complete: {len(self.text_content)} characters")
+            with self._open_pdf() as doc:
+                for page_number, page in enumerate(doc):
+                    # A page that uses no fonts has no text layer (a scan); leave it to OCR
+                    if not page.get_fonts():
+                        self._page_texts.append('')
+                        continue
+
+                    page_lines = []
+                    for block in page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]:
+                        for line in block.get("lines", ()):  # Image blocks have no lines
+                            text = ''.join(span["text"] for span in line["spans"])
+                            page_lines.append(text)
+
+                            spans = [span for span in line["spans"] if span["text"].strip()]
+                            if spans:
+                                self._font_lines.append((
+                                    page_number,
+                                    text.strip(),
+                                    max(span["size"] for span in spans),
+                                    all(span["flags"] & _BOLD_FLAG for span in spans),
+                                ))
+                    self._page_texts.append('\n'.join(page_lines))
+
+            # Only pages with no text layer at all go to OCR; a text page that is merely
+            # short (a closing "References available on request") is already complete
+            self._textless_pages = [n for n, text in enumerate(self._page_texts) if not text.strip()]
+            self.text_content = _join_pages(self._page_texts)
+            logger.info(
+                "✅ PDF text extraction complete: %d characters from %d pages",
+                len(self.text_content), len(self._page_texts)
+            )
 
         except Exception as e:
-            logger.error(f"❌ PDF text extraction failed: {e}")
+            logger.error("❌ PDF text extraction failed: %s", e)
+            self._extraction_ok = False
             self.text_content = ""
 
-    def extract_text_with_ocr(self):
-        """Extract text using OCR as fallback"""
+    def extract_text_with_ocr(self, page_numbers=None):
+        """Extract text using OCR as fallback, for the given pages (default: all)"""
         try:
             logger.info("🔍 Starting OCR text extraction...")
 
-            # Convert PDF to images
-            images = convert_from_path(self.file_path, dpi=300)
-            ocr_text_parts = []
-
-            for i, image in enumerate(images):
-                try:
-                    # Perform OCR on each page
-                    page_text = pytesseract.image_to_string(image, lang='eng')
-                    if page_text.strip():
-                        ocr_text_parts.append(page_text)
-                        logger.info(f"📸 OCR extracted from page {i + 1}: {len(page_text)} chars")
-                except Exception as e:
-                    logger.warning(f"⚠️ OCR failed for page {i + 1}: {e}")
-
-            if ocr_text_parts:
-                self.text_content = '\n'.join(ocr_text_parts)
-                logger.info(f"✅ OCR extraction complete: {len(self.text_content)} characters")
-            else:
+            # Render pages with PyMuPDF - no Poppler subprocess or temp files
+            with self._open_pdf() as doc:
+                if page_numbers is None:
+                    page_numbers = list(range(doc.page_count))
+                page_texts = self._page_texts or [''] * doc.page_count
+                ocr_texts = dict(zip(page_numbers, self._ocr_pages(doc, page_numbers, self.dpi)))
+
+                # Retry scanned pages that came back (nearly) empty at a higher resolution;
+                # a page with embedded text keeps that text whatever OCR makes of it
+                retry_pages = [
+                    n for n, text in ocr_texts.items()
+                    if len(text.strip()) < MIN_PAGE_TEXT_CHARS and not page_texts[n].strip()
+                ]
+                if retry_pages and self.dpi < OCR_RETRY_DPI:
+                    logger.info("🔁 Retrying %d page(s) at %d dpi", len(retry_pages), OCR_RETRY_DPI)
+                    for n, text in zip(retry_pages, self._ocr_pages(doc, retry_pages, OCR_RETRY_DPI)):
+                        if len(text.strip()) > len(ocr_texts[n].strip()):
+                            ocr_texts[n] = text
+
+            if not any(text.strip() for text in ocr_texts.values()):
                 logger.warning("⚠️ OCR extraction yielded no text")
+                return
+
+            # Keep whichever of embedded/OCR text is richer for each page
+            for n, text in ocr_texts.items():
+                if len(text.strip()) > len(page_texts[n].strip()):
+                    page_texts[n] = text
+                    self._font_lines = []  # OCR text carries no font info; fall back to keywords
+
+            self._page_texts = page_texts
+            self.text_content = _join_pages(page_texts)
+            logger.info("✅ OCR extraction complete: %d characters", len(self.text_content))
 
         except Exception as e:
-            logger.error(f"❌ OCR extraction failed: {e}")
+            logger.error("❌ OCR extraction failed: %s", e)
+            self._extraction_ok = False
+
+    def _ocr_pages(self, doc, page_numbers, dpi):
+        """Render the given pages at dpi and OCR them in parallel; returns one string per page"""
+        if not page_numbers:
+            return []
+
+        page_images = [
+            doc[n].get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY).tobytes("png")
+            for n in page_numbers
+        ]
+
+        # A worker killed mid-page (OOM, segfault) breaks the whole pool and every later
+        # submit fails; replace the pool and give these pages one more try on the new one
+        for attempt in range(2):
+            executor = _get_ocr_pool()
+            try:
+                return self._ocr_images(executor, page_numbers, page_images)
+            except BrokenProcessPool:
+                logger.error("❌ OCR worker pool broke, starting a new one")
+                _discard_ocr_pool(executor)
+                if attempt:
+                    raise
+
+    def _ocr_images(self, executor, page_numbers, page_images):
+        """OCR rendered pages on executor; returns one string per page"""
+        # Without a resident engine and with no second worker to share pages with (one core,
+        # or OCR inline in a parse worker), one tesseract run over all pages saves a process
+        # start per page; otherwise pages fan out across the pool below
+        serial = OCR_MAX_WORKERS == 1 or isinstance(executor, _InlineExecutor)
+        if PyTessBaseAPI is None and serial and len(page_images) > 1:
+            try:
+                page_texts = executor.submit(_ocr_batch, page_images).result()
+                logger.info("📸 OCR extracted %d pages in one Tesseract run", len(page_texts))
+                return page_texts
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.warning("⚠️ Batched OCR failed, retrying page by page: %s", e)
+
+        # OCR is CPU-bound and independent per page, so fan pages out across cores
+        page_texts = []
+        futures = [executor.submit(_ocr_page, png_bytes) for png_bytes in page_images]
+
+        for n, future in zip(page_numbers, futures):
+            try:
+                page_text = future.result()
+                logger.debug("📸 OCR extracted from page %d: %d chars", n + 1, len(page_text))
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.warning("⚠️ OCR failed for page %d: %s", n + 1, e)
+                self._extraction_ok = False
+                page_text = ""
+            page_texts.append(page_text)
+
+        return page_texts
 
     def parse_personal_information(self):
         """Parse personal information from text"""
         logger.info("👤 Parsing personal information...")
+        self._ensure_tokenized()
 
         personal = {}
-        text_lower = self.text_content.lower()
-
-        # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, self.text_content, re.IGNORECASE)
-        if emails:
-            personal['email'] = emails[0]
-
-        # Phone extraction
-        phone_patterns = [
-            r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\b\d{3}[-.]?\d{4}[-.]?\d{4}\b'
-        ]
 
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, self.text_content)
-            if phones:
-                if isinstance(phones[0], tuple):
-                    personal['phone'] = f"({phones[0][0]}) {phones[0][1]}-{phones[0][2]}"
-                else:
-                    personal['phone'] = phones[0]
-                break
+        lines = self._lines
+        header_end = self._line_starts[5] if len(lines) > 5 else len(self.text_content)
+
+        # Email, phone, LinkedIn and website in a single scan; first hit of each kind wins.
+        # The same scan marks which of the first lines hold an email or phone number
+        contacts = {}
+        contact_lines = set()
+        for match in _CONTACT_RE.finditer(self.text_content):
+            kind, value = match.lastgroup, match.group()
+            if kind in _NAME_EXCLUDE_KINDS and match.start() < header_end:
+                contact_lines.add(bisect_right(self._line_starts, match.start()) - 1)
+            if kind == 'phone':
+                value = f"({match.group('area')}) {match.group('exchange')}-{match.group('line')}"
+            elif kind == 'linkedin_url':
+                kind, value = 'linkedin', match.group('linkedin_path')
+            elif kind == 'website' and 'linkedin' in value.lower():
+                continue  # Exclude LinkedIn URLs
+            contacts.setdefault(kind, value)
+
+        if 'email' in contacts:
+            personal['email'] = contacts['email']
+
+        # US numbers take precedence over the longer international format
+        phone = contacts.get('phone') or contacts.get('phone_intl')
+        if phone:
+            personal['phone'] = phone
 
         # Name extraction (first few lines, excluding email/phone)
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        for line in lines[:5]:
-            if not re.search(email_pattern, line, re.IGNORECASE) and not re.search(r'\d{3}[-.]?\d{3}[-.]?\d{4}', line):
-                if len(line.split()) >= 2 and len(line) < 50:
-                    personal['full_name'] = line
-
-                    # Split into first and last name
-                    name_parts = line.split()
-                    if len(name_parts) >= 2:
-                        personal['first_name'] = name_parts[0]
-                        personal['last_name'] = name_parts[-1]
-                    break
+        name_candidates = [line for i, line in enumerate(lines[:5]) if i not in contact_lines]
+
+        # The largest text on the first page is usually the name, so try it first
+        title_line = self._largest_first_page_line()
+        if title_line and not any(
+            match.lastgroup in _NAME_EXCLUDE_KINDS for match in _CONTACT_RE.finditer(title_line)
+        ):
+            name_candidates.insert(0, title_line)
+
+        for line in name_candidates:
+            if len(line.split()) >= 2 and len(line) < 50:
+                personal['full_name'] = line
+
+                # Split into first and last name
+                name_parts = line.split()
+                if len(name_parts) >= 2:
+                    personal['first_name'] = name_parts[0]
+                    personal['last_name'] = name_parts[-1]
+                break
 
         # Address extraction (enhanced)
-        address_keywords = ['street', 'ave', 'avenue', 'road', 'rd', 'drive', 'dr', 'lane', 'ln', 'blvd', 'boulevard']
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in address_keywords):
-                personal['address'] = line
-                break
-            # Also look for city, state patterns
-            elif re.search(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}', line):
+        for line in lines[:ADDRESS_SCAN_LINES]:
+            if _ADDRESS_RE.search(line):
                 personal['address'] = line
                 break
 
         # LinkedIn URL extraction
-        linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
-        linkedin_match = re.search(linkedin_pattern, self.text_content, re.IGNORECASE)
-        if linkedin_match:
-            personal['linkedin'] = 'https://' + linkedin_match.group()
+        if 'linkedin' in contacts:
+            personal['linkedin'] = 'https://' + contacts['linkedin']
 
         # Website/Portfolio extraction
-        website_pattern = r'https?://[\w\.\-]+\.[a-z]{2,}'
-        website_matches = re.findall(website_pattern, self.text_content, re.IGNORECASE)
-        if website_matches:
-            for url in website_matches:
-                if 'linkedin' not in url.lower():  # Exclude LinkedIn URLs
-                    personal['website'] = url
-                    break
+        if 'website' in contacts:
+            personal['website'] = contacts['website']
 
         self.parsed_data['personal'] = personal
-        logger.info(f"✅ Extracted personal info: {', '.join(personal.keys())}")
-
-    def parse_experience(self):
-        """Parse work experience"""
-        logger.info("💼 Parsing work experience...")
-
-        experience = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Extracted personal info: %s", ', '.join(personal.keys()))
 
-        # Look for experience section
-        experience_section = False
-        current_job = {}
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Start of experience section
-            if any(keyword in line_lower for keyword in ['experience', 'employment', 'work history']):
-                experience_section = True
-                continue
-
-            # Stop at next section
-            if experience_section and any(keyword in line_lower for keyword in ['education', 'skills', 'projects']):
-                if current_job:
-                    experience.append(current_job)
-                break
-
-            if experience_section:
-                # Job title and company patterns
-                if re.search(r'\b(manager|director|engineer|developer|analyst|coordinator|assistant|specialist)\b', line_lower):
-                    if current_job:
-                        experience.append(current_job)
-
-                    current_job = {
-                        'title': line.strip(),
-                        'company': '',
-                        'dates': '',
-                        'description': ''
-                    }
-
-                    # Extract dates
-                    date_match = re.search(r'\b(20\d{2}|19\d{2})\s*[-–]\s*(20\d{2}|19\d{2}|present)\b', line, re.IGNORECASE)
-                    if date_match:
-                        current_job['dates'] = date_match.group()
-
-                # Company extraction
-                elif current_job and not current_job.get('company'):
-                    if any(indicator in line_lower for indicator in ['inc', 'corp', 'llc', 'company', 'ltd']):
-                        current_job['company'] = line.strip()
-
-        if current_job:
-            experience.append(current_job)
-
-        self.parsed_data['experience'] = experience[:5]  # Limit to 5 entries
-        logger.info(f"✅ Extracted {len(experience)} work experiences")
-
-    def parse_education(self):
-        """Parse education with improved validation"""
-        logger.info("🎓 Parsing education...")
+    def _parse_sections(self):
+        """Parse summary, experience, education, skills, projects, languages and certifications in one pass"""
+        logger.info("🧭 Parsing resume sections...")
+        self._ensure_tokenized()
 
+        summary_lines = []
+        experience, current_job = [], None
         education = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-
-        education_section = False
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Start of education section
-            if any(keyword in line_lower for keyword in ['education', 'academic']):
-                education_section = True
-                continue
-
-            # Stop at next section
-            if education_section and any(keyword in line_lower for keyword in ['experience', 'skills', 'projects', 'work']):
-                break
+        all_skills, technical_skills = set(), set()
+        projects, current_project = [], None
+        languages = []
+        certifications = []
 
-            # Only process if we're in education section OR line clearly indicates academic institution
-            if education_section or any(keyword in line_lower for keyword in ['university', 'college']):
-                # Skip lines that look like work experience
-                work_indicators = ['instructor', 'teacher', 'manager', 'director', 'engineer', 'developer']
-                if any(indicator in line_lower for indicator in work_indicators):
-                    continue
-
-                # Institution patterns - be more specific
-                if any(keyword in line_lower for keyword in ['university', 'college', 'institute']) and not any(indicator in line_lower for indicator in work_indicators):
-                    edu_entry = {
-                        'school': line.strip(),
-                        'degree': '',
-                        'year': ''
-                    }
+        # Find technical and soft skills mentioned anywhere in the text
+        found_tech, found_soft = _find_skills(self._text_lower, frozenset().union(*self._line_tokens))
+        found_tech = {skill.title() for skill in found_tech}
+        technical_skills.update(found_tech)
+        all_skills.update(found_tech)
+        all_skills.update(skill.title() for skill in found_soft)
+
+        # Each section keeps its own state: sections may overlap (education also
+        # picks up stray 'University' lines) and the skills section can reopen
+        summary_section = summary_done = False
+        experience_section = experience_done = False
+        education_section = education_done = False
+        skills_section = technical_section = False
+        projects_section = projects_done = False
+        languages_section = languages_done = False
+        certifications_section = certifications_done = False
+
+        for line, line_lower, tokens, is_header in zip(
+            self._lines, self._lines_lower, self._line_tokens, self._header_mask
+        ):
+            keywords = _section_keywords(line_lower)
+            header = keywords if is_header else ()
+
+            # Summary / objective
+            if not summary_done:
+                if not _SUMMARY_HDR.isdisjoint(header):
+                    summary_section = True
+                elif summary_section and not _SUMMARY_END.isdisjoint(header):
+                    summary_done = True
+                elif summary_section and len(line) > 20:
+                    summary_lines.append(line)
+                    summary_done = len(summary_lines) == SUMMARY_MAX_LINES
+
+            # Work experience
+            if not experience_done:
+                if not _EXPERIENCE_HDR.isdisjoint(header):
+                    experience_section = True
+                elif experience_section and not _EXPERIENCE_END.isdisjoint(header):
+                    if current_job is not None:
+                        experience.append(current_job)
+                        current_job = None
+                    experience_done = True
+                elif experience_section:
+                    # Job title and company patterns
+                    if _JOB_TITLE_RE.search(line_lower):
+                        if current_job is not None:
+                            experience.append(current_job)
+
+                        current_job = JobEntry(title=line)
+
+                        # Extract dates
+                        date_match = _DATE_RANGE_RE.search(line)
+                        if date_match:
+                            current_job.dates = date_match.group()
+
+                    # Company extraction
+                    elif current_job is not None and not current_job.company:
+                        if not _COMPANY_TOKENS.isdisjoint(tokens):
+                            current_job.company = line
+
+                experience_done = experience_done or len(experience) >= MAX_EXPERIENCE
+
+            # Education - in the section, or any line that clearly names an academic institution
+            if not education_done:
+                if not _EDU_HDR.isdisjoint(header):
+                    education_section = True
+                elif education_section and not _EDU_END.isdisjoint(header):
+                    education_done = True
+                elif (
+                    (education_section or not _ACADEMIC_TOKENS.isdisjoint(tokens))
+                    and _WORK_INDICATOR_TOKENS.isdisjoint(tokens)  # Skip lines that look like work experience
+                    and not _INSTITUTION_TOKENS.isdisjoint(tokens)
+                ):
+                    edu_entry = EduEntry(school=line)
 
                     # Look for degree
-                    if any(degree in line_lower for degree in ['bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree']):
-                        edu_entry['degree'] = line.strip()
+                    if not _DEGREE_TOKENS.isdisjoint(tokens):
+                        edu_entry.degree = line
 
                     # Extract year
-                    year_match = re.search(r'\b(20\d{2}|19\d{2})\b', line)
+                    year_match = _YEAR_RE.search(line)
                     if year_match:
-                        edu_entry['year'] = year_match.group()
+                        edu_entry.year = year_match.group()
 
                     education.append(edu_entry)
 
-        self.parsed_data['education'] = education[:3]
-        logger.info(f"✅ Extracted {len(education)} education entries")
-
-    def parse_skills(self):
-        """Parse skills and technologies"""
-        logger.info("🛠️ Parsing skills...")
-
-        all_skills = set()
-        technical_skills = set()
-
-        # Technical skills keywords
-        tech_skills_list = [
-            'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
-            'react', 'vue', 'angular', 'node', 'express', 'django', 'flask', 'rails',
-            'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github',
-            'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'matplotlib',
-            'linux', 'windows', 'macos', 'unix', 'bash', 'powershell'
-        ]
-
-        # Soft skills keywords
-        soft_skills_list = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
-            'creative', 'adaptable', 'organized', 'detail-oriented', 'time management',
-            'project management', 'customer service', 'presentation', 'negotiation'
-        ]
-
-        text_lower = self.text_content.lower()
-
-        # Find technical skills mentioned in text
-        for skill in tech_skills_list:
-            if skill in text_lower:
-                technical_skills.add(skill.title())
-                all_skills.add(skill.title())
-
-        # Find soft skills mentioned in text
-        for skill in soft_skills_list:
-            if skill in text_lower:
-                all_skills.add(skill.title())
-
-        # Look for skills section
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        skills_section = False
-        technical_section = False
-
-        for line in lines:
-            line_lower = line.lower()
-
-            if any(keyword in line_lower for keyword in ['skills', 'technologies', 'tools', 'technical skills']):
+            # Skills lists
+            if not _SKILLS_HDR.isdisjoint(header):
                 skills_section = True
                 if 'technical' in line_lower:
                     technical_section = True
-                continue
-
-            if skills_section:
-                if any(keyword in line_lower for keyword in ['experience', 'education', 'projects', 'languages']):
+            elif skills_section:
+                if not _SKILLS_END.isdisjoint(header):
                     skills_section = False
                     technical_section = False
-                    continue
+                else:
+                    # Extract skills from lists
+                    for word in _SKILL_SPLIT_RE.split(line):
+                        word = word.strip()
+                        if len(word) > 2 and len(word) < 25:
+                            all_skills.add(word)
+
+                            # Check if it's a technical skill
+                            if technical_section or _TECH_SKILLS_RE.search(word):
+                                technical_skills.add(word)
+
+            # Projects
+            if not projects_done:
+                if not _PROJECTS_HDR.isdisjoint(header):
+                    projects_section = True
+                elif projects_section and not _PROJECTS_END.isdisjoint(header):
+                    if current_project is not None:
+                        projects.append(current_project)
+                        current_project = None
+                    projects_done = True
+                elif projects_section:
+                    # Project title (usually standalone lines with specific patterns)
+                    if not line.startswith(_BULLETS):
+                        if current_project is not None:
+                            projects.append(current_project)
+
+                        current_project = ProjectEntry(name=line)
+
+                    # Project description (usually bullet points)
+                    elif current_project is not None and not current_project.description:
+                        current_project.description = line
+
+                projects_done = projects_done or len(projects) >= MAX_PROJECTS
+
+            # Languages
+            if not languages_done:
+                if not _LANGUAGES_HDR.isdisjoint(header):
+                    languages_section = True
+                elif languages_section and not _LANGUAGES_END.isdisjoint(header):
+                    languages_done = True
+                elif languages_section:
+                    # Extract languages from the line, in the order they are listed
+                    for lang in dict.fromkeys(_LANGUAGE_RE.findall(line_lower)):
+                        # Check for proficiency level
+                        proficiency = 'conversational'
+                        if _FLUENT_RE.search(line_lower):
+                            proficiency = 'fluent'
+                        elif _BASIC_RE.search(line_lower):
+                            proficiency = 'basic'
+
+                        languages.append(LanguageEntry(lang.title(), proficiency))
 
-                # Extract skills from lists
-                skill_words = re.split(r'[,•·\-\n|/]', line)
-                for word in skill_words:
-                    word = word.strip()
-                    if len(word) > 2 and len(word) < 25:
-                        all_skills.add(word)
+            # Certifications - in the section, or any line mentioning one
+            if not certifications_done:
+                if not _CERT_HDR.isdisjoint(header):
+                    certifications_section = True
+                elif certifications_section and not _CERT_END.isdisjoint(header):
+                    certifications_done = True
+                elif (certifications_section or not _CERT_KEYWORDS.isdisjoint(keywords)) and len(line) > 5:
+                    cert_entry = CertEntry(name=line)
 
-                        # Check if it's a technical skill
-                        if technical_section or any(tech in word.lower() for tech in tech_skills_list):
-                            technical_skills.add(word)
+                    # Extract year
+                    year_match = _YEAR_RE.search(line)
+                    if year_match:
+                        cert_entry.year = year_match.group()
+
+                    certifications.append(cert_entry)
 
+        if current_job is not None:
+            experience.append(current_job)
+        if current_project is not None:
+            projects.append(current_project)
+
+        self.parsed_data['summary'] = ' '.join(summary_lines)
+        self.parsed_data['experience'] = [job.to_dict() for job in experience[:MAX_EXPERIENCE]]
+        self.parsed_data['education'] = [edu.to_dict() for edu in education[:3]]
         self.parsed_data['skills'] = list(all_skills)[:25]
         self.parsed_data['technical_skills'] = list(technical_skills)[:15]
-        logger.info(f"✅ Extracted {len(all_skills)} total skills, {len(technical_skills)} technical skills")
+        self.parsed_data['projects'] = [project.to_dict() for project in projects[:MAX_PROJECTS]]
+        self.parsed_data['languages'] = [lang.to_dict() for lang in languages]
+        self.parsed_data['certifications'] = [cert.to_dict() for cert in certifications[:5]]  # Limit to 5 certifications
+
+        logger.info("✅ Extracted summary: %d characters", len(self.parsed_data['summary']))
+        logger.info("✅ Extracted %d work experiences", len(experience))
+        logger.info("✅ Extracted %d education entries", len(education))
+        logger.info("✅ Extracted %d total skills, %d technical skills", len(all_skills), len(technical_skills))
+        logger.info("✅ Extracted %d projects", len(projects))
+        logger.info("✅ Extracted %d languages", len(languages))
+        logger.info("✅ Extracted %d certifications", len(certifications))
 
     def clean_and_validate_data(self):
         """Clean and validate parsed data"""
@@ -369,12 +927,12 @@ class ResumeParser:
             # Validate email
             if 'email' in personal:
                 email = personal['email']
-                if not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$', email):
+                if not _EMAIL_VALIDATE_RE.match(email):
                     del personal['email']
 
             # Clean phone number
             if 'phone' in personal:
-                phone = re.sub(r'[^\d\+\-\(\)\s]', '', personal['phone'])
+                phone = _PHONE_CLEAN_RE.sub('', personal['phone'])
                 personal['phone'] = phone.strip()
 
         # Clean experience
@@ -386,167 +944,3 @@ class ResumeParser:
             self.parsed_data['experience'] = cleaned_experience
 
         logger.info("✅ Data cleaning completed")
-
-    def parse_summary(self):
-        """Parse professional summary or objective"""
-        logger.info("📝 Parsing summary/objective...")
-
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        summary_text = ""
-
-        # Look for summary section
-        summary_section = False
-        summary_lines = []
-
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-
-            # Start of summary section
-            if any(keyword in line_lower for keyword in ['summary', 'objective', 'profile', 'about']):
-                summary_section = True
-                continue
-
-            # Stop at next section
-            if summary_section and any(keyword in line_lower for keyword in ['experience', 'education', 'skills', 'employment']):
-                break
-
-            if summary_section and line and len(line) > 20:
-                summary_lines.append(line)
-
-        if summary_lines:
-            summary_text = ' '.join(summary_lines[:3])  # Limit to first 3 lines
-
-        self.parsed_data['summary'] = summary_text
-        logger.info(f"✅ Extracted summary: {len(summary_text)} characters")
-
-    def parse_projects(self):
-        """Parse projects section"""
-        logger.info("🚀 Parsing projects...")
-
-        projects = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-
-        projects_section = False
-        current_project = {}
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Start of projects section
-            if any(keyword in line_lower for keyword in ['projects', 'portfolio']):
-                projects_section = True
-                continue
-
-            # Stop at next section
-            if projects_section and any(keyword in line_lower for keyword in ['experience', 'education', 'skills']):
-                if current_project:
-                    projects.append(current_project)
-                break
-
-            if projects_section:
-                # Project title (usually standalone lines with specific patterns)
-                if line and not line.startswith('-') and not line.startswith('•'):
-                    if current_project:
-                        projects.append(current_project)
-
-                    current_project = {
-                        'name': line.strip(),
-                        'description': '',
-                        'technologies': []
-                    }
-
-                # Project description (usually bullet points)
-                elif current_project and (line.startswith('-') or line.startswith('•')):
-                    if not current_project['description']:
-                        current_project['description'] = line.strip()
-
-        if current_project:
-            projects.append(current_project)
-
-        self.parsed_data['projects'] = projects[:5]  # Limit to 5 projects
-        logger.info(f"✅ Extracted {len(projects)} projects")
-
-    def parse_languages(self):
-        """Parse languages section"""
-        logger.info("🌐 Parsing languages...")
-
-        languages = []
-        text_lower = self.text_content.lower()
-
-        # Common languages
-        language_list = [
-            'english', 'spanish', 'french', 'german', 'italian', 'portuguese', 'chinese',
-            'japanese', 'korean', 'arabic', 'russian', 'hindi', 'mandarin', 'cantonese'
-        ]
-
-        # Look for languages section
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        languages_section = False
-
-        for line in lines:
-            line_lower = line.lower()
-
-            if any(keyword in line_lower for keyword in ['languages', 'language']):
-                languages_section = True
-                continue
-
-            if languages_section:
-                if any(keyword in line_lower for keyword in ['experience', 'education', 'skills', 'projects']):
-                    break
-
-                # Extract languages from the line
-                for lang in language_list:
-                    if lang in line_lower:
-                        # Check for proficiency level
-                        proficiency = 'conversational'
-                        if any(level in line_lower for level in ['native', 'fluent']):
-                            proficiency = 'fluent'
-                        elif any(level in line_lower for level in ['basic', 'beginner']):
-                            proficiency = 'basic'
-
-                        languages.append({
-                            'language': lang.title(),
-                            'proficiency': proficiency
-                        })
-
-        self.parsed_data['languages'] = languages
-        logger.info(f"✅ Extracted {len(languages)} languages")
-
-    def parse_certifications(self):
-        """Parse certifications and licenses"""
-        logger.info("🏆 Parsing certifications...")
-
-        certifications = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-
-        certifications_section = False
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Start of certifications section
-            if any(keyword in line_lower for keyword in ['certifications', 'certificates', 'licenses']):
-                certifications_section = True
-                continue
-
-            # Stop at next section
-            if certifications_section and any(keyword in line_lower for keyword in ['experience', 'education', 'skills', 'projects']):
-                break
-
-            if certifications_section or any(cert in line_lower for cert in ['certified', 'certificate', 'license']):
-                if line and len(line) > 5:
-                    cert_entry = {
-                        'name': line.strip(),
-                        'issuer': '',
-                        'year': ''
-                    }
-
-                    # Extract year
-                    year_match = re.search(r'\b(20\d{2}|19\d{2})\b', line)
-                    if year_match:
-                        cert_entry['year'] = year_match.group()
-
-                    certifications.append(cert_entry)
-
-        self.parsed_data['certifications'] = certifications[:5]  # Limit to 5 certifications
-        logger.info(f"✅ Extracted {len(certifications)} certifications")
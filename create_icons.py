@@ -6,19 +6,23 @@ Simple script to create placeholder icons for the Chrome extension
 from PIL import Image, ImageDraw, ImageFont
 import os
 
-def create_icon(size, filename):
-    """Create a simple icon with the given size"""
-    # Create a new image with a gradient background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+ICON_SIZES = (128, 48, 16)  # Largest first: the smaller icons are scaled down from it
 
-    # Create a gradient background
+def build_icon(size):
+    """Draw the icon at the given size and return the image"""
+    # Create a gradient background. The colour only changes from left to right, so
+    # compute one row of pixels and stretch it to full height instead of setting
+    # every pixel individually
+    row = bytearray()
     for i in range(size):
-        for j in range(size):
-            r = int(102 + (126 - 102) * i / size)  # 667eea to 764ba2 gradient
-            g = int(126 + (75 - 126) * i / size)
-            b = int(234 + (162 - 234) * i / size)
-            img.putpixel((i, j), (r, g, b, 255))
+        row += bytes((
+            int(102 + (126 - 102) * i / size),  # 667eea to 764ba2 gradient
+            int(126 + (75 - 126) * i / size),
+            int(234 + (162 - 234) * i / size),
+            255,
+        ))
+    img = Image.frombytes('RGBA', (size, 1), bytes(row)).resize((size, size), Image.NEAREST)
+    draw = ImageDraw.Draw(img)
 
     # Draw a simple document icon
     margin = size // 8
@@ -43,17 +47,21 @@ def create_icon(size, filename):
             fill=(150, 150, 150, 255)
         )
 
-    # Save the image
+    return img
+
+def save_icon(img, filename):
+    """Save an icon image to the icons/ folder"""
     os.makedirs('icons', exist_ok=True)
     img.save(f'icons/{filename}', 'PNG')
-    print(f"Created {filename} ({size}x{size})")
+    print(f"Created {filename} ({img.width}x{img.height})")
 
 if __name__ == '__main__':
     try:
-        # Create icons of different sizes
-        create_icon(16, 'icon16.png')
-        create_icon(48, 'icon48.png')
-        create_icon(128, 'icon128.png')
+        # Draw the largest icon once and downscale it for the smaller sizes
+        master = build_icon(ICON_SIZES[0])
+        for size in ICON_SIZES:
+            icon = master if size == master.width else master.resize((size, size), Image.LANCZOS)
+            save_icon(icon, f'icon{size}.png')
         print("✅ All icons created successfully!")
     except ImportError:
         print("❌ Pillow not installed. Creating simple placeholder files...")
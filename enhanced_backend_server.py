@@ -6,35 +6,56 @@ Sophisticated PDF parsing with OCR fallback (converted from Rails version)
 
 import os
 import re
-import json
+import sys
 import tempfile
+import threading
+import json
 import logging
 import requests
-import hashlib
 import html
 import mimetypes
 import time
 from datetime import datetime
-from pathlib import Path
+from io import BytesIO, StringIO
+from itertools import islice
+from bisect import bisect_right
 from functools import wraps
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 
+# Pages are OCR'd on OCR_THREADS threads at once, so each Tesseract sticks to one
+# OpenMP thread instead of every page spinning up one per core. Set before Tesseract
+# is loaded (tesserocr) or launched (pytesseract), both of which read it from the environment
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 # PDF and OCR libraries
+import pymupdf
 import PyPDF2
 from PIL import Image
 import pytesseract
 try:
-    from pdf2image.pdf2image import convert_from_path
+    from pdf2image.pdf2image import convert_from_bytes
+except ImportError:
+    convert_from_bytes = None
+
+try:
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    import orjson
 except ImportError:
-    convert_from_path = None
+    orjson = None
 
-# Configure logging
+# Configure logging - RESUME_DEBUG=1 turns on the per-request debug logs
+DEBUG = os.environ.get('RESUME_DEBUG') == '1'
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if DEBUG else logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -42,20 +63,184 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Chrome extension
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes and decodes with orjson's C implementation"""
+
+        # Same sorted keys as Flask's default provider; non-str keys are stringified like json does
+        OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            # jsonify() bodies go out as orjson's bytes; the default provider would
+            # decode them to str in dumps() only for the response to encode them again
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=self.default, option=self.OPTIONS | orjson.OPT_APPEND_NEWLINE)
+            return self._app.response_class(body, mimetype=self.mimetype)
+
+    app.json = OrjsonProvider(app)
+
 # Configuration
-UPLOAD_FOLDER = tempfile.gettempdir()
 ALLOWED_EXTENSIONS = {'pdf'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 PORT = 3000  # Consolidated port for Chrome extension compatibility
+# Parallel page rendering (pdftoppm) and OCR (tesseract) jobs per server process. The
+# built-in server is one process and gets every core; under gunicorn each of the -w
+# workers would size itself to the whole machine, so workers default to one each.
+# RESUME_OCR_THREADS overrides both (see README)
+OCR_THREADS = int(os.environ.get('RESUME_OCR_THREADS', 0)) or (
+    1 if 'gunicorn' in sys.modules else os.cpu_count() or 1
+)
 
 # LLM Configuration
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_MODEL = "llama3.2:3b"  # Default model, can be configured
 LLM_TIMEOUT = 30  # seconds
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
+# Contact regexes, compiled once at import and shared by every request. The local part
+# is capped at its RFC 5321 limit of 64 characters: left unbounded, a long run of
+# dot-separated text with no '@' made the search quadratic (seconds on a 40 KB line)
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_EMAIL_VALIDATE_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+_PHONE_INTL_RE = re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{2,4}\)?[-.\s]?\d{2,4}[-.\s]?\d{2,4}')
+_PHONE_CLEAN_RE = re.compile(r'[^\d\+\-\(\)\s]')
+
+# Email, US phone, LinkedIn and GitHub in one pass over the resume; alternatives are
+# tried in this order at each position and the group name comes back as lastgroup.
+# The looser international phone pattern would swallow '+1 555 123 4567' whole,
+# so it is only searched for when no US number was found
+_CONTACT_RE = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in (
+    ('email', _EMAIL_PATTERN),
+    ('phone', r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    ('linkedin', r'(?i:linkedin\.com/in/[\w-]+)'),
+    ('github', r'(?i:github\.com/[\w-]+)'),
+)))
+_CONTACT_KINDS = len(_CONTACT_RE.groupindex)
+# Contact details sit near the top of a resume; the personal-info scans never look
+# further than this many characters into the extracted text
+MAX_CONTACT_SCAN_CHARS = 200 * 1024
+_ADDRESS_RES = (
+    re.compile(r'\b\w+,\s*[A-Z]{2}\s*\d{5}'),  # City, ST 12345
+    re.compile(r'\b\w+\s+\w+,\s*[A-Z]{2}'),    # City Name, ST
+)
+
+def _keyword_re(*keywords):
+    """Compile keywords into one alternation that matches like `any(kw in line_lower ...)`"""
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+# Resume section keywords, each list scanned with one regex search per line
+_EXPERIENCE_HDR_RE = _keyword_re('experience', 'employment', 'work history', 'professional')
+_EXPERIENCE_END_RE = _keyword_re('education', 'skills', 'projects')
+_EDUCATION_HDR_RE = _keyword_re('education', 'academic')
+_EDUCATION_END_RE = _keyword_re('experience', 'skills', 'projects', 'work')
+_ACADEMIC_RE = _keyword_re('university', 'college')
+_INSTITUTION_RE = _keyword_re('university', 'college', 'institute')
+_WORK_INDICATOR_RE = _keyword_re(
+    'instructor', 'teacher', 'manager', 'director', 'engineer', 'developer',
+    'analyst', 'coordinator', 'assistant', 'specialist', 'representative',
+    'consultant', 'administrator'
+)
+_DEGREE_RE = _keyword_re('bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree')
+_SKILLS_HDR_RE = _keyword_re('skills', 'technologies', 'tools', 'languages')
+_SKILLS_END_RE = _keyword_re('experience', 'education', 'projects')
+
+# Technical skills keywords; single words are looked up in the resume's word set
+_TECH_SKILLS = frozenset({
+    'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
+    'react', 'vue', 'angular', 'node', 'express', 'django', 'flask', 'rails',
+    'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github',
+    'linux', 'windows', 'macos', 'bash', 'powershell',
+    'ai', 'analytics', 'tableau', 'powerbi'
+})
+# '+' and '#' are word characters here so 'c++' and 'c#' survive; '.' is not, so
+# 'node.js' yields 'node' and a sentence-final 'python.' still yields 'python'
+_SKILL_WORD_RE = re.compile(r'[a-z0-9+#]+')
+# Multi-word skills, found in one pass and bounded by the same word characters
+_TECH_SKILL_PHRASE_RE = re.compile(r'(?<![a-z0-9+#])(?:machine learning|data science)(?![a-z0-9+#])')
+_SKILL_SPLIT_RE = re.compile(r'[,•·\-\n]')
+
+# Experience line patterns
+_COMPANY_SUFFIX_RE = re.compile(r'\b(Inc|LLC|Corp|Company|Ltd|Group|Agency|Studio)\b', re.IGNORECASE)
+_JOB_TITLE_RE = re.compile(
+    r'\b(Engineer|Developer|Manager|Analyst|Coordinator|Specialist|Director|Associate)\b', re.IGNORECASE
+)
+_YEAR_RE = re.compile(r'\b(20\d{2}|19\d{2})\b')
+_MONTH_RE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b')
+_DATE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(20\d{2}|19\d{2})\b',
+    r'\b(20\d{2}|19\d{2})\s*-\s*(20\d{2}|19\d{2})\b',
+    r'\b(20\d{2}|19\d{2})\b'
+))
+
+# LinkedIn profile text patterns
+_LINKEDIN_HEADERS = frozenset({
+    'PERSONAL INFORMATION', 'EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS', 'LANGUAGES', 'SUMMARY'
+})
+_LINKEDIN_SECTION_HEADERS = frozenset({'EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS'})
+# Profiles are only scanned for the programming/platform keywords, not the data ones
+_LINKEDIN_TECH_SKILLS = _TECH_SKILLS - {'ai', 'analytics', 'tableau', 'powerbi'}
+_LINKEDIN_HEADLINE_RE = _keyword_re(
+    'developer', 'engineer', 'manager', 'analyst', 'coordinator', 'specialist', 'director', 'lead', 'senior', 'junior'
+)
+_LINKEDIN_LOCATION_RE = _keyword_re(
+    'japan', 'tokyo', 'california', 'san francisco', 'new york', 'london', 'paris', 'berlin', 'amsterdam',
+    'singapore', 'sydney', 'toronto', 'vancouver'
+)
+_LINKEDIN_JOB_TITLE_RE = _keyword_re(
+    'engineer', 'developer', 'manager', 'analyst', 'coordinator', 'specialist', 'director', 'lead', 'senior',
+    'junior', 'consultant', 'architect'
+)
+_LINKEDIN_COMPANY_RE = _keyword_re(
+    'inc', 'llc', 'corp', 'company', 'ltd', 'group', 'agency', 'startup', 'tech', 'systems', 'solutions'
+)
+_LINKEDIN_EDUCATION_END_RE = _keyword_re('experience', 'skills', 'projects')
+_LINKEDIN_SCHOOL_RE = _keyword_re('university', 'college', 'institute', 'school')
+_LINKEDIN_DEGREE_RE = _keyword_re(
+    'bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree', 'diploma', 'certificate'
+)
+_LINKEDIN_PHONE_RE = re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b')
+_CITY_COUNTRY_RE = re.compile(r'[A-Z][a-z]+,\s*[A-Z][a-z]+')
+
+# Rule-based LinkedIn enhancement patterns, tried in order against the page content
+_COMPANY_NAME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(AEON Corporation)',
+    r'(Anchor Studio Corporation)',
+    r'(Gaba Corporation)',
+    r'(Embassy Suites)',
+    r'([A-Z][a-z]+ (?:Corporation|Company|Inc|LLC|Ltd))',
+    r'([A-Z][a-z]+ [A-Z][a-z]+)(?=\s*·\s*(?:Permanent|Part-time|Full-time|Contract))'
+))
+_EDUCATION_NAME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(University of [A-Z][a-z]+)',
+    r'([A-Z][a-z]+ University)',
+    r'([A-Z][a-z]+ College)',
+    r'(Le Wagon)',
+    r'(Bachelor[\'s]*\s+(?:of|in)\s+[A-Z][a-z\s]+)',
+    r'(Master[\'s]*\s+(?:of|in)\s+[A-Z][a-z\s]+)'
+))
+
+# LLM prompt sanitizing
+_LLM_UNSAFE_CHARS_RE = re.compile(r'[^\w\s\.\,\-\@\(\)\[\]]+')
+_PROMPT_INJECTION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'ignore\s+previous\s+instructions',
+    r'system\s*:',
+    r'assistant\s*:',
+    r'<\|.*?\|>',
+    r'\[INST\].*?\[/INST\]'
+))
+
 # Rate limiting storage
 rate_limits = defaultdict(list)
 
@@ -91,7 +276,7 @@ def sanitize_llm_input(text, max_length=2000):
         return ""
     
     # Remove potentially dangerous patterns
-    text = re.sub(r'[^\w\s\.\,\-\@\(\)\[\]]+', '', text)
+    text = _LLM_UNSAFE_CHARS_RE.sub('', text)
     
     # HTML escape
     text = html.escape(text)
@@ -100,21 +285,13 @@ def sanitize_llm_input(text, max_length=2000):
     text = text[:max_length]
     
     # Remove common prompt injection patterns
-    dangerous_patterns = [
-        r'ignore\s+previous\s+instructions',
-        r'system\s*:',
-        r'assistant\s*:',
-        r'<\|.*?\|>',
-        r'\[INST\].*?\[/INST\]'
-    ]
-    
-    for pattern in dangerous_patterns:
-        text = re.sub(pattern, '[FILTERED]', text, flags=re.IGNORECASE)
+    for pattern in _PROMPT_INJECTION_RES:
+        text = pattern.sub('[FILTERED]', text)
     
     return text
 
-def validate_and_save_file(file):
-    """Securely validate and save uploaded file"""
+def read_validated_upload(file):
+    """Securely validate an uploaded file and return its contents"""
     if not file or not file.filename:
         raise ValueError("Invalid file object")
     
@@ -134,42 +311,155 @@ def validate_and_save_file(file):
     if mime_type != 'application/pdf':
         raise ValueError(f"Invalid MIME type: {mime_type}")
     
-    # Generate secure filename with hash
-    timestamp = str(int(time.time()))
-    file_content = file.read(512)  # Read first 512 bytes for hash
-    file.seek(0)  # Reset
-    file_hash = hashlib.sha256(file_content).hexdigest()[:8]
-    secure_name = f"pdf_{timestamp}_{file_hash}.pdf"
-    
-    # Use absolute path with restricted directory
-    upload_dir = Path(UPLOAD_FOLDER).resolve()
-    file_path = upload_dir / secure_name
-    
-    # Ensure path is within allowed directory
-    if not str(file_path).startswith(str(upload_dir)):
-        raise ValueError("Path traversal attempt detected")
-    
-    # Save with restricted permissions
-    file.save(str(file_path))
-    os.chmod(file_path, 0o600)  # Read/write for owner only
-    
-    return str(file_path), secure_name
+    # The PDF is parsed straight from memory; it never touches the disk
+    return file.read()
+
+def _log_parsed_data(parsed_data):
+    """Debug-log a summary of parsed data; skipped entirely unless DEBUG is enabled"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("🔍 [API] Parsed data keys: %s", list(parsed_data.keys()))
+    for key, value in parsed_data.items():
+        if isinstance(value, list):
+            logger.debug("🔍 [API] %s: %d items", key, len(value))
+        elif isinstance(value, dict):
+            logger.debug("🔍 [API] %s: %s", key, value)
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def _split_lines(text, text_lower):
+    """Non-empty stripped lines of text, paired with the same lines of its lowercased copy
+    and the offset in text_lower where each of those lines starts"""
+    # Lowercasing never adds or removes newlines, so both copies split into the same lines
+    lines, lines_lower, starts = [], [], []
+    offset = 0
+    for line, line_lower in zip(text.split('\n'), text_lower.split('\n')):
+        line = line.strip()
+        if line:
+            lines.append(line)
+            lines_lower.append(line_lower.strip())
+            starts.append(offset)
+        offset += len(line_lower) + 1
+    return lines, lines_lower, starts
+
+# Long-lived OCR threads shared by all requests; with tesserocr each one keeps its
+# own Tesseract engine loaded instead of starting the tesseract CLI for every page
+_ocr_executor = None
+_ocr_executor_lock = threading.Lock()
+_ocr_thread = threading.local()
+
+def _get_ocr_executor():
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is None:
+            _ocr_executor = ThreadPoolExecutor(max_workers=OCR_THREADS, thread_name_prefix='ocr')
+        return _ocr_executor
+
+def _ocr_page(page_number, image_path):
+    """OCR one rendered page file with Tesseract"""
+    logger.debug("🖼️ Processing page %d...", page_number)
+
+    if PyTessBaseAPI is not None:
+        # A PyTessBaseAPI must not be shared between threads, so each OCR thread gets one
+        api = getattr(_ocr_thread, 'api', None)
+        if api is None:
+            api = _ocr_thread.api = PyTessBaseAPI(lang='eng')
+        api.SetImageFile(image_path)
+        return api.GetUTF8Text()
+
+    # Fallback: pytesseract forks the tesseract CLI for every page, which reads the file itself
+    return pytesseract.image_to_string(image_path)
+
+def _ocr_batch(image_paths, tmp_dir):
+    """OCR several rendered page files with one tesseract run over an image-list file"""
+    list_path = os.path.join(tmp_dir, "pages.txt")
+    with open(list_path, 'w') as f:
+        f.write('\n'.join(image_paths) + '\n')
+
+    text = pytesseract.image_to_string(list_path)
+
+    # Tesseract ends every page with a form feed; keep it so each page reads exactly
+    # as a single-image run would have returned it
+    page_texts = text.split('\f')
+    if len(page_texts) <= len(image_paths):
+        raise ValueError(f"expected {len(image_paths)} pages, got {len(page_texts) - 1}")
+    return [page_text + '\f' for page_text in page_texts[:len(image_paths)]]
+
+def _iter_lines(text):
+    """Non-empty stripped lines of text, produced one at a time so callers can stop early"""
+    for line in StringIO(text):
+        line = line.strip()
+        if line:
+            yield line
+
+def _name_parts(line):
+    """The words of line if it looks like a person's name, else None"""
+    # 2-4 words of letters in any script, so 'José Müller' counts; labels such as
+    # 'Email Address' and single-word headings like 'SUMMARY' don't
+    if len(line) > 50:
+        return None
+    words = line.split()
+    if not 2 <= len(words) <= 4 or not all(word.isalpha() for word in words):
+        return None
+    line_lower = line.lower()
+    if 'phone' in line_lower or 'email' in line_lower:
+        return None
+    return words
+
+def _line_around(text, match):
+    """The stripped line of text that a single-line regex match falls on"""
+    # Search outwards from the match for the enclosing newlines instead of splitting the text
+    start = text.rfind('\n', 0, match.start()) + 1
+    end = text.find('\n', match.end())
+    return text[start:end if end != -1 else len(text)].strip()
+
 class EnhancedResumeParser:
     """Enhanced resume parser with OCR fallback (converted from Rails ResumeParserService)"""
 
-    def __init__(self, file_path):
+    def __init__(self, file_path=None, pdf_bytes=None):
         self.file_path = file_path
+        self.pdf_bytes = pdf_bytes  # Uploads are parsed from memory; file_path is read on first use
         self.text_content = ""
         self.parsed_data = {}
 
+    @property
+    def text_content(self):
+        return self._text_content
+
+    @text_content.setter
+    def text_content(self, text):
+        self._text_content = text
+        self._split = None  # Re-split on next use
+
+    def _split_text(self):
+        """(text_lower, lines, lines_lower, line_starts) for the current text, computed once for all parse_* methods"""
+        if self._split is None:
+            text_lower = self._text_content.lower()
+            self._split = (text_lower, *_split_lines(self._text_content, text_lower))
+        return self._split
+
+    def _section_start(self, header_re):
+        """Index of the first line header_re matches (len(lines) if none), from one search of the whole text"""
+        # Keywords never span a newline, so the line holding the first match in the
+        # lowercased text is the first line a per-line search would have stopped at
+        text_lower, _, _, line_starts = self._split_text()
+        match = header_re.search(text_lower)
+        if match is None:
+            return len(line_starts)
+        return bisect_right(line_starts, match.start()) - 1
+
+    def _read_pdf(self):
+        """The PDF's bytes, read from file_path once if they weren't passed in"""
+        if self.pdf_bytes is None:
+            with open(self.file_path, 'rb') as file:
+                self.pdf_bytes = file.read()
+        return self.pdf_bytes
+
     def parse(self):
         """Main parsing method"""
-        logger.info(f"🚀 Starting resume parsing for file: {self.file_path}")
+        logger.info("🚀 Starting resume parsing for file: %s", self.file_path or 'upload in memory')
 
         try:
             # Step 1: Extract text from PDF
@@ -194,22 +484,21 @@ class EnhancedResumeParser:
     def extract_text_from_pdf(self):
         """Extract text from PDF with OCR fallback"""
         try:
-            logger.info("📖 Extracting text from PDF...")
+            logger.debug("📖 Extracting text from PDF...")
 
-            # Try direct text extraction first
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                extracted_text = ""
-
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        extracted_text += page_text + "\n"
+            # Try direct text extraction first - PyMuPDF's native extractor is several
+            # times faster than PyPDF2's; PyPDF2 stays as a fallback for files MuPDF rejects
+            try:
+                with pymupdf.open(stream=self._read_pdf(), filetype="pdf") as doc:
+                    extracted_text = ''.join(page.get_text() + "\n" for page in doc)
+            except Exception as e:
+                logger.warning(f"⚠️ PyMuPDF could not read the PDF, retrying with PyPDF2: {str(e)}")
+                extracted_text = self.extract_text_with_pypdf2()
 
             # If we got meaningful text, use it
             if len(extracted_text.strip()) > 100:
                 self.text_content = extracted_text
-                logger.info(f"✅ Text extraction successful ({len(self.text_content)} characters)")
+                logger.info("✅ Text extraction successful (%d characters)", len(self.text_content))
                 return
 
             # Fallback to OCR if direct extraction failed
@@ -221,31 +510,51 @@ class EnhancedResumeParser:
             # Try OCR as fallback
             self.extract_text_with_ocr()
 
+    def extract_text_with_pypdf2(self):
+        """Extract the text layer with PyPDF2"""
+        pdf_reader = PyPDF2.PdfReader(BytesIO(self._read_pdf()))
+        page_texts = (page.extract_text() for page in pdf_reader.pages)
+        return ''.join(page_text + "\n" for page_text in page_texts if page_text)
+
     def extract_text_with_ocr(self):
         """Extract text using OCR (converted from Rails OCR logic)"""
         try:
             logger.info("🔍 Starting OCR extraction...")
 
             # Convert PDF to images
-            if convert_from_path is None:
+            if convert_from_bytes is None:
                 logger.error("❌ pdf2image is not available. Cannot perform OCR extraction.")
                 self.text_content = "Error: pdf2image is not available. Cannot perform OCR extraction."
                 return
 
-            images = convert_from_path(self.file_path, dpi=300)
-
-            # Extract text from each image using Tesseract
-            ocr_text = ""
-            for i, image in enumerate(images):
-                logger.info(f"🖼️ Processing page {i + 1}...")
-
-                # Convert PIL image to text using pytesseract
-                page_text = pytesseract.image_to_string(image)
-                if page_text:
-                    ocr_text += page_text + "\n"
-
-            self.text_content = ocr_text
-            logger.info(f"✅ OCR extraction completed ({len(self.text_content)} characters)")
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # pdf2image splits the pages between OCR_THREADS pdftoppm processes (never
+                # more than there are pages) and leaves them as files for Tesseract to read,
+                # so no page is ever decoded into a PIL image in this process. Pages are
+                # rendered grayscale - Tesseract binarizes to one channel anyway, and the
+                # files are a third the size of RGB ones
+                image_paths = convert_from_bytes(
+                    self._read_pdf(), dpi=300, thread_count=OCR_THREADS,
+                    output_folder=tmp_dir, paths_only=True, grayscale=True
+                )
+
+                # Extract text from each image using Tesseract. Pages are OCR'd side by side
+                # on the shared OCR threads; map() keeps them in page order
+                page_texts = []
+                if PyTessBaseAPI is None and OCR_THREADS == 1 and len(image_paths) > 1:
+                    # With no resident engine and no second worker to share pages with, one
+                    # tesseract run over all of them saves a process start and model load per page
+                    try:
+                        page_texts = _ocr_batch(image_paths, tmp_dir)
+                        logger.info("🖼️ OCR'd %d pages in one Tesseract run", len(page_texts))
+                    except Exception as e:
+                        logger.warning(f"⚠️ Batched OCR failed, retrying page by page: {str(e)}")
+                if image_paths and not page_texts:
+                    executor = _get_ocr_executor()
+                    page_texts = list(executor.map(_ocr_page, range(1, len(image_paths) + 1), image_paths))
+
+            self.text_content = ''.join(page_text + "\n" for page_text in page_texts if page_text)
+            logger.info("✅ OCR extraction completed (%d characters)", len(self.text_content))
 
         except Exception as e:
             logger.error(f"❌ OCR extraction failed: {str(e)}")
@@ -253,99 +562,90 @@ class EnhancedResumeParser:
 
     def parse_personal_information(self):
         """Parse personal information (converted from Rails logic)"""
-        logger.info("👤 Parsing personal information...")
+        logger.debug("👤 Parsing personal information...")
 
         personal = {}
+        scan_text = self.text_content[:MAX_CONTACT_SCAN_CHARS]
 
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, self.text_content)
-        if email_matches:
-            personal['email'] = email_matches[0]
-
-        # Extract phone number
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-            r'\+?\d{1,3}[-.\s]?\(?\d{2,4}\)?[-.\s]?\d{2,4}[-.\s]?\d{2,4}'  # International
-        ]
-
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, self.text_content)
-            if phone_matches:
-                personal['phone'] = phone_matches[0].strip()
+        # Extract email, phone, LinkedIn and GitHub - the first match of each kind wins
+        contacts = {}
+        for match in _CONTACT_RE.finditer(scan_text):
+            contacts.setdefault(match.lastgroup, match.group())
+            if len(contacts) == _CONTACT_KINDS:
                 break
 
+        if 'email' in contacts:
+            personal['email'] = contacts['email']
+
+        if 'phone' not in contacts:
+            phone_match = _PHONE_INTL_RE.search(scan_text)
+            if phone_match:
+                contacts['phone'] = phone_match.group()
+        if 'phone' in contacts:
+            personal['phone'] = contacts['phone'].strip()
+
         # Extract name (first line that looks like a name)
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        for line in lines[:5]:
-            if re.match(r'^[A-Za-z\s]{2,50}$', line) and not re.search(r'@|\.com|phone|email', line, re.IGNORECASE):
-                personal['full_name'] = line.strip()
-                name_parts = line.strip().split()
-                if name_parts:
-                    personal['first_name'] = name_parts[0]
-                if len(name_parts) > 1:
-                    personal['last_name'] = name_parts[-1]
+        for line in islice(_iter_lines(self.text_content), 5):
+            name_parts = _name_parts(line)
+            if name_parts:
+                personal['full_name'] = line
+                personal['first_name'] = name_parts[0]
+                personal['last_name'] = name_parts[-1]
                 break
 
-        # Extract LinkedIn
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', self.text_content, re.IGNORECASE)
-        if linkedin_match:
-            personal['linkedin'] = f"https://{linkedin_match.group()}"
+        # Profile links found by the contact scan above
+        if 'linkedin' in contacts:
+            personal['linkedin'] = f"https://{contacts['linkedin']}"
 
-        # Extract GitHub
-        github_match = re.search(r'github\.com/[\w-]+', self.text_content, re.IGNORECASE)
-        if github_match:
-            personal['github'] = f"https://{github_match.group()}"
+        if 'github' in contacts:
+            personal['github'] = f"https://{contacts['github']}"
 
         # Extract address (lines with city/state patterns)
-        address_patterns = [
-            r'\b\w+,\s*[A-Z]{2}\s*\d{5}',  # City, ST 12345
-            r'\b\w+\s+\w+,\s*[A-Z]{2}',    # City Name, ST
-        ]
-
-        for pattern in address_patterns:
-            address_match = re.search(pattern, self.text_content)
+        for pattern in _ADDRESS_RES:
+            address_match = pattern.search(scan_text)
             if address_match:
-                # Look for full address in the lines around this match
-                for line in lines:
-                    if address_match.group() in line:
-                        personal['address'] = line.strip()
-                        break
+                # The full address is the line the match sits on; a match that runs
+                # across a line break isn't one line, so no address is taken from it
+                if '\n' not in address_match.group():
+                    personal['address'] = _line_around(scan_text, address_match)
                 break
 
         self.parsed_data['personal'] = personal
-        logger.info(f"✅ Extracted personal info: {', '.join(personal.keys())}")
+        logger.debug("✅ Extracted personal info: %s", ', '.join(personal))
 
     def parse_experience(self):
         """Parse work experience (enhanced from Rails logic)"""
-        logger.info("💼 Parsing work experience...")
+        logger.debug("💼 Parsing work experience...")
 
         experience = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
+        _, lines, lines_lower, _ = self._split_text()
 
-        # Look for experience section
+        # Look for experience section - lines before its header are never read
         experience_section = False
         current_job = {}
+        start = self._section_start(_EXPERIENCE_HDR_RE)
 
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-
+        for line, line_lower in zip(lines[start:], lines_lower[start:]):
             # Start of experience section
-            if any(keyword in line_lower for keyword in ['experience', 'employment', 'work history', 'professional']):
+            if _EXPERIENCE_HDR_RE.search(line_lower):
                 experience_section = True
                 continue
 
             # Stop at next section
-            if experience_section and any(keyword in line_lower for keyword in ['education', 'skills', 'projects']):
+            if experience_section and _EXPERIENCE_END_RE.search(line_lower):
                 if current_job:
                     experience.append(current_job)
                 break
 
             if experience_section:
                 # Company name patterns (lines with "at", "Inc", "LLC", etc.)
-                if re.search(r'\b(Inc|LLC|Corp|Company|Ltd|Group|Agency|Studio)\b', line, re.IGNORECASE):
+                if _COMPANY_SUFFIX_RE.search(line):
                     if current_job:
                         experience.append(current_job)
+                        # Only the first 5 jobs are kept, so stop reading once they're in
+                        if len(experience) == 5:
+                            current_job = {}
+                            break
 
                     current_job = {
                         'company': line.strip(),
@@ -356,12 +656,12 @@ class EnhancedResumeParser:
                     }
 
                 # Job title patterns
-                elif re.search(r'\b(Engineer|Developer|Manager|Analyst|Coordinator|Specialist|Director|Associate)\b', line, re.IGNORECASE):
+                elif _JOB_TITLE_RE.search(line):
                     if current_job and not current_job.get('title'):
                         current_job['title'] = line.strip()
 
                 # Date patterns
-                elif re.search(r'\b(20\d{2}|19\d{2})\b', line):
+                elif _YEAR_RE.search(line):
                     dates = self.extract_dates_from_string(line, current_job)
 
         # Add last job if exists
@@ -369,43 +669,36 @@ class EnhancedResumeParser:
             experience.append(current_job)
 
         self.parsed_data['experience'] = experience[:5]  # Limit to 5 most recent
-        logger.info(f"✅ Extracted {len(experience)} work experiences")
+        logger.debug("✅ Extracted %d work experiences", len(experience))
 
     def parse_education(self):
         """Parse education information (enhanced from Rails logic)"""
-        logger.info("🎓 Parsing education...")
+        logger.debug("🎓 Parsing education...")
 
         education = []
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
+        _, lines, lines_lower, _ = self._split_text()
 
         # Look for education section
         education_section = False
 
-        for line in lines:
-            line_lower = line.lower()
-
+        for line, line_lower in zip(lines, lines_lower):
             # Start of education section
-            if any(keyword in line_lower for keyword in ['education', 'academic']):
+            if _EDUCATION_HDR_RE.search(line_lower):
                 education_section = True
                 continue
 
             # Stop at next section
-            if education_section and any(keyword in line_lower for keyword in ['experience', 'skills', 'projects', 'work']):
+            if education_section and _EDUCATION_END_RE.search(line_lower):
                 break
 
             # Only process if we're in education section OR line clearly indicates academic institution
-            if education_section or any(keyword in line_lower for keyword in ['university', 'college']):
+            if education_section or _ACADEMIC_RE.search(line_lower):
                 # Skip lines that look like work experience (job titles, instructor/teacher roles)
-                work_indicators = ['instructor', 'teacher', 'manager', 'director', 'engineer', 'developer',
-                                 'analyst', 'coordinator', 'assistant', 'specialist', 'representative',
-                                 'consultant', 'administrator']
-
-                # Skip if this looks like work experience
-                if any(indicator in line_lower for indicator in work_indicators):
+                if _WORK_INDICATOR_RE.search(line_lower):
                     continue
 
                 # Institution patterns - be more specific
-                if any(keyword in line_lower for keyword in ['university', 'college', 'institute']) and not any(indicator in line_lower for indicator in work_indicators):
+                if _INSTITUTION_RE.search(line_lower):
                     edu_entry = {
                         'school': line.strip(),
                         'degree': '',
@@ -413,82 +706,68 @@ class EnhancedResumeParser:
                     }
 
                     # Look for degree in same line or nearby lines
-                    if any(degree in line_lower for degree in ['bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree']):
+                    if _DEGREE_RE.search(line_lower):
                         edu_entry['degree'] = line.strip()
 
                     # Extract year
-                    year_match = re.search(r'\b(20\d{2}|19\d{2})\b', line)
+                    year_match = _YEAR_RE.search(line)
                     if year_match:
                         edu_entry['year'] = year_match.group()
 
                     education.append(edu_entry)
+                    if len(education) == 3:
+                        break
 
         self.parsed_data['education'] = education[:3]  # Limit to 3 entries
-        logger.info(f"✅ Extracted {len(education)} education entries")
+        logger.debug("✅ Extracted %d education entries", len(education))
 
     def parse_skills(self):
         """Parse skills and technologies (enhanced from Rails logic)"""
-        logger.info("🛠️ Parsing skills...")
+        logger.debug("🛠️ Parsing skills...")
 
         skills = set()
 
-        # Technical skills keywords
-        tech_skills = [
-            'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
-            'react', 'vue', 'angular', 'node', 'express', 'django', 'flask', 'rails',
-            'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github',
-            'linux', 'windows', 'macos', 'bash', 'powershell',
-            'machine learning', 'ai', 'data science', 'analytics', 'tableau', 'powerbi'
-        ]
-
-        text_lower = self.text_content.lower()
-
-        # Find skills mentioned in text
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.add(skill.title())
-
-        # Look for skills section
-        lines = [line.strip() for line in self.text_content.split('\n') if line.strip()]
-        skills_section = False
+        text_lower, lines, lines_lower, _ = self._split_text()
+
+        # Find skills mentioned in text - matched as whole words, so 'java' no longer
+        # fires on 'javascript', 'go' on 'good' or 'ai' on 'email'
+        words = set(_SKILL_WORD_RE.findall(text_lower))
+        skills.update(skill.title() for skill in _TECH_SKILLS & words)
+        skills.update(phrase.title() for phrase in set(_TECH_SKILL_PHRASE_RE.findall(text_lower)))
 
-        for line in lines:
-            line_lower = line.lower()
+        # Look for skills section - lines before its header are never read
+        skills_section = False
+        start = self._section_start(_SKILLS_HDR_RE)
 
-            if any(keyword in line_lower for keyword in ['skills', 'technologies', 'tools', 'languages']):
+        for line, line_lower in zip(lines[start:], lines_lower[start:]):
+            if _SKILLS_HDR_RE.search(line_lower):
                 skills_section = True
                 continue
 
             if skills_section:
-                # Stop at next section
-                if any(keyword in line_lower for keyword in ['experience', 'education', 'projects']):
+                # Stop at next section, or once there are as many skills as are kept
+                if _SKILLS_END_RE.search(line_lower) or len(skills) >= 20:
                     break
 
                 # Extract skills from lists (comma-separated, bullet points, etc.)
-                skill_words = re.split(r'[,•·\-\n]', line)
+                skill_words = _SKILL_SPLIT_RE.split(line)
                 for word in skill_words:
                     word = word.strip()
                     if len(word) > 2 and len(word) < 20:
                         skills.add(word)
 
         self.parsed_data['skills'] = list(skills)[:20]  # Limit to 20 skills
-        logger.info(f"✅ Extracted {len(skills)} skills")
+        logger.debug("✅ Extracted %d skills", len(skills))
 
     def extract_dates_from_string(self, date_string, record):
         """Extract start and end dates from a string"""
-        # Common date patterns
-        date_patterns = [
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(20\d{2}|19\d{2})\b',
-            r'\b(20\d{2}|19\d{2})\s*-\s*(20\d{2}|19\d{2})\b',
-            r'\b(20\d{2}|19\d{2})\b'
-        ]
-
+        # Common date patterns - only the first two dates found are used, so the
+        # remaining patterns aren't run once there are two
         dates_found = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, date_string, re.IGNORECASE)
-            dates_found.extend(matches)
+        for pattern in _DATE_RES:
+            dates_found.extend(pattern.findall(date_string))
+            if len(dates_found) >= 2:
+                break
 
         if len(dates_found) >= 2:
             record['start_date'] = str(dates_found[0])
@@ -500,7 +779,7 @@ class EnhancedResumeParser:
 
     def clean_and_validate_data(self):
         """Clean and validate the parsed data"""
-        logger.info("🧹 Cleaning and validating data...")
+        logger.debug("🧹 Cleaning and validating data...")
 
         # Clean personal info
         if 'personal' in self.parsed_data:
@@ -509,12 +788,12 @@ class EnhancedResumeParser:
             # Validate email
             if 'email' in personal:
                 email = personal['email']
-                if not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$', email):
+                if not _EMAIL_VALIDATE_RE.match(email):
                     del personal['email']
 
             # Clean phone number
             if 'phone' in personal:
-                phone = re.sub(r'[^\d\+\-\(\)\s]', '', personal['phone'])
+                phone = _PHONE_CLEAN_RE.sub('', personal['phone'])
                 personal['phone'] = phone.strip()
 
         # Clean experience
@@ -525,7 +804,7 @@ class EnhancedResumeParser:
                     cleaned_experience.append(exp)
             self.parsed_data['experience'] = cleaned_experience
 
-        logger.info("✅ Data cleaning completed")
+        logger.debug("✅ Data cleaning completed")
 
 def check_system_dependencies():
     """Check if required system dependencies are installed"""
@@ -542,7 +821,7 @@ def check_system_dependencies():
 
     # Check Poppler (for pdf2image)
     try:
-        if convert_from_path:
+        if convert_from_bytes:
             logger.info("✅ Poppler/pdf2image found")
         else:
             logger.warning("⚠️ Poppler/pdf2image not found")
@@ -555,13 +834,33 @@ def check_system_dependencies():
     else:
         logger.info("✅ All system dependencies found")
 
+def _too_large_response():
+    """JSON error returned for request bodies over MAX_CONTENT_LENGTH"""
+    return jsonify({
+        'success': False,
+        'error': f'File too large (max: {MAX_FILE_SIZE} bytes)'
+    }), 413
+
+@app.before_request
+def reject_oversize_request():
+    """Turn away oversize uploads by their Content-Length before any of the body is read"""
+    content_length = request.content_length
+    if content_length is not None and content_length > app.config['MAX_CONTENT_LENGTH']:
+        logger.warning(f"⚠️ [API] Rejected {content_length}-byte request to {request.path}")
+        return _too_large_response()
+
+@app.errorhandler(413)
+def request_entity_too_large(error):
+    """Werkzeug's 413 for bodies without a Content-Length that overrun the limit while streaming"""
+    return _too_large_response()
+
 @app.route('/resume/parse_api', methods=['POST'])
 @rate_limit(max_requests=5, window_seconds=60)
 def parse_resume():
     """Parse uploaded resume PDF with OCR fallback"""
 
     logger.info("🔍 [API] Received resume upload request")
-    logger.info(f"🔍 [API] Request files: {list(request.files.keys())}")
+    logger.debug("🔍 [API] Request files: %s", list(request.files.keys()))
 
     if 'resume_file' not in request.files:
         return jsonify({
@@ -570,7 +869,7 @@ def parse_resume():
         }), 400
 
     file = request.files['resume_file']
-    logger.info(f"🔍 [API] File received: {file.filename}")
+    logger.debug("🔍 [API] File received: %s", file.filename)
 
     if file.filename == '':
         logger.error("❌ [API] Empty filename")
@@ -580,42 +879,27 @@ def parse_resume():
         }), 400
 
     if not allowed_file(file.filename):
-        logger.error(f"❌ [API] Invalid file type: {file.filename}")
+        logger.error("❌ [API] Invalid file type: %s", file.filename)
         return jsonify({
             'success': False,
             'error': 'Only PDF files are allowed'
         }), 400
 
     try:
-        logger.info("🔍 [API] Starting PDF processing...")
+        logger.debug("🔍 [API] Starting PDF processing...")
 
-        # Use secure file validation and saving
-        file_path, secure_name = validate_and_save_file(file)
-        logger.info(f"🔍 [API] Saving file to: {file_path}")
-
-        logger.info("✅ [API] File saved successfully")
-
-        # Check file size
-        file_size = os.path.getsize(file_path)
-        logger.info(f"🔍 [API] Saved file size: {file_size} bytes")
+        # Validate the upload and parse it from memory - no temp file to write or clean up
+        pdf_bytes = read_validated_upload(file)
+        logger.debug("🔍 [API] Upload size: %d bytes", len(pdf_bytes))
 
         # Parse using enhanced parser
-        logger.info("🔍 [API] Starting enhanced parsing...")
-        parser = EnhancedResumeParser(file_path)
+        logger.debug("🔍 [API] Starting enhanced parsing...")
+        parser = EnhancedResumeParser(pdf_bytes=pdf_bytes)
         parsed_data = parser.parse()
 
         # Log parsing results
-        logger.info("✅ [API] Parsing successful")
-        logger.info(f"🔍 [API] Parsed data keys: {list(parsed_data.keys())}")
-        for key, value in parsed_data.items():
-            if isinstance(value, list):
-                logger.info(f"🔍 [API] {key}: {len(value)} items")
-            elif isinstance(value, dict):
-                logger.info(f"🔍 [API] {key}: {value}")
-
-        # Clean up temp file
-        os.remove(file_path)
-        logger.info("✅ [API] Temporary file cleaned up")
+        logger.debug("✅ [API] Parsing successful")
+        _log_parsed_data(parsed_data)
 
         logger.info("✅ [API] Processing completed successfully")
         return jsonify({
@@ -629,14 +913,6 @@ def parse_resume():
         logger.error(f"❌ [API] Exception occurred: {str(e)}")
         logger.error(f"❌ [API] Exception type: {type(e).__name__}")
 
-        # Clean up temp file if it exists
-        if 'file_path' in locals() and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                logger.info("✅ [API] Cleaned up temp file after error")
-            except Exception as cleanup_error:
-                logger.warning(f"⚠️ [API] Failed to cleanup temp file: {cleanup_error}")
-
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
@@ -664,21 +940,16 @@ def parse_linkedin_profile():
         }), 400
 
     try:
-        logger.info("🔍 [API] Starting LinkedIn profile parsing...")
-        logger.info(f"🔍 [API] Profile text length: {len(profile_text)} characters")
-        logger.info(f"🔍 [API] First 200 chars: {profile_text[:200]}")
+        logger.debug("🔍 [API] Starting LinkedIn profile parsing...")
+        logger.debug("🔍 [API] Profile text length: %d characters", len(profile_text))
+        logger.debug("🔍 [API] First 200 chars: %s", profile_text[:200])
 
         # Parse the LinkedIn profile text directly
         parsed_data = parse_linkedin_text(profile_text)
 
         # Log parsing results
-        logger.info("✅ [API] LinkedIn parsing successful")
-        logger.info(f"🔍 [API] Parsed data keys: {list(parsed_data.keys())}")
-        for key, value in parsed_data.items():
-            if isinstance(value, list):
-                logger.info(f"🔍 [API] {key}: {len(value)} items")
-            elif isinstance(value, dict):
-                logger.info(f"🔍 [API] {key}: {value}")
+        logger.debug("✅ [API] LinkedIn parsing successful")
+        _log_parsed_data(parsed_data)
 
         return jsonify({
             'success': True,
@@ -694,6 +965,95 @@ def parse_linkedin_profile():
             'error': f'Server error: {str(e)}'
         }), 500
 
+def _parse_linkedin_personal_line(personal, i, line, line_lower, line_upper):
+    """Pick up any personal information on one line of a LinkedIn profile"""
+    # Skip section headers
+    if line_upper in _LINKEDIN_HEADERS:
+        return
+
+    # Look for labeled personal info
+    if line.startswith('Name:'):
+        name = line.replace('Name:', '').strip()
+        if name and 'information' not in name.lower():
+            personal['full_name'] = name
+            # Split name
+            name_parts = name.split()
+            if len(name_parts) >= 2:
+                personal['first_name'] = name_parts[0]
+                personal['last_name'] = name_parts[-1]
+        return
+
+    if line.startswith('Headline:'):
+        headline = line.replace('Headline:', '').strip()
+        if headline:
+            personal['headline'] = headline
+        return
+
+    if line.startswith('Location:'):
+        location = line.replace('Location:', '').strip()
+        if location:
+            personal['location'] = location
+        return
+
+    if line.startswith('Email:'):
+        email = line.replace('Email:', '').strip()
+        if email and '@' in email:
+            personal['email'] = email
+        return
+
+    if line.startswith('Phone:'):
+        phone = line.replace('Phone:', '').strip()
+        if phone:
+            personal['phone'] = phone
+        return
+
+    if line.startswith('LinkedIn:'):
+        linkedin = line.replace('LinkedIn:', '').strip()
+        if linkedin:
+            personal['linkedin'] = linkedin
+        return
+
+    # Fallback: Name (usually first line or prominent, but not section headers or labels)
+    if (i < 5 and len(line) > 3 and len(line) < 100 and
+        'developer' not in line_lower and 'engineer' not in line_lower and
+        'information' not in line_lower and ':' not in line and
+        not line.startswith('School:') and not line.startswith('Degree:') and
+        not line.startswith('Year:') and not line.startswith('Title:') and
+        not line.startswith('Company:') and not line.startswith('Dates:') and
+        not line.startswith('Description:')):
+        if not personal.get('full_name'):
+            personal['full_name'] = line
+            # Split name
+            name_parts = line.split()
+            if len(name_parts) >= 2:
+                personal['first_name'] = name_parts[0]
+                personal['last_name'] = name_parts[-1]
+            return
+
+    # Fallback: Headline (look for job titles in personal section)
+    if _LINKEDIN_HEADLINE_RE.search(line_lower) and len(line) < 200:
+        if not personal.get('headline'):
+            personal['headline'] = line
+            return
+
+    # Fallback: Email
+    if '@' in line and '.' in line and len(line) < 100:
+        email_match = _EMAIL_RE.search(line)
+        if email_match:
+            personal['email'] = email_match.group()
+            return
+
+    # Fallback: Phone
+    phone_match = _LINKEDIN_PHONE_RE.search(line)
+    if phone_match:
+        personal['phone'] = phone_match.group()
+        return
+
+    # Fallback: Location (look for city, country patterns)
+    if _LINKEDIN_LOCATION_RE.search(line_lower) or _CITY_COUNTRY_RE.search(line):
+        if not personal.get('location'):
+            personal['location'] = line
+
 def parse_linkedin_text(text):
     """Parse LinkedIn profile text and extract structured data"""
 
@@ -706,294 +1066,176 @@ def parse_linkedin_text(text):
 
     lines = [line.strip() for line in text.split('\n') if line.strip()]
 
-    # Extract personal information
-    for i, line in enumerate(lines):
-        # Skip section headers
-        if line.upper() in ['PERSONAL INFORMATION', 'EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS', 'LANGUAGES', 'SUMMARY']:
-            continue
-
-        # Look for labeled personal info
-        if line.startswith('Name:'):
-            name = line.replace('Name:', '').strip()
-            if name and 'information' not in name.lower():
-                parsed_data['personal']['full_name'] = name
-                # Split name
-                name_parts = name.split()
-                if len(name_parts) >= 2:
-                    parsed_data['personal']['first_name'] = name_parts[0]
-                    parsed_data['personal']['last_name'] = name_parts[-1]
-            continue
-
-        if line.startswith('Headline:'):
-            headline = line.replace('Headline:', '').strip()
-            if headline:
-                parsed_data['personal']['headline'] = headline
-            continue
-
-        if line.startswith('Location:'):
-            location = line.replace('Location:', '').strip()
-            if location:
-                parsed_data['personal']['location'] = location
-            continue
-
-        if line.startswith('Email:'):
-            email = line.replace('Email:', '').strip()
-            if email and '@' in email:
-                parsed_data['personal']['email'] = email
-            continue
-
-        if line.startswith('Phone:'):
-            phone = line.replace('Phone:', '').strip()
-            if phone:
-                parsed_data['personal']['phone'] = phone
-            continue
-
-        if line.startswith('LinkedIn:'):
-            linkedin = line.replace('LinkedIn:', '').strip()
-            if linkedin:
-                parsed_data['personal']['linkedin'] = linkedin
-            continue
-
-        # Fallback: Name (usually first line or prominent, but not section headers or labels)
-        if (i < 5 and len(line) > 3 and len(line) < 100 and
-            'developer' not in line.lower() and 'engineer' not in line.lower() and
-            'information' not in line.lower() and ':' not in line and
-            not line.startswith('School:') and not line.startswith('Degree:') and
-            not line.startswith('Year:') and not line.startswith('Title:') and
-            not line.startswith('Company:') and not line.startswith('Dates:') and
-            not line.startswith('Description:')):
-            if not parsed_data['personal'].get('full_name'):
-                parsed_data['personal']['full_name'] = line
-                # Split name
-                name_parts = line.split()
-                if len(name_parts) >= 2:
-                    parsed_data['personal']['first_name'] = name_parts[0]
-                    parsed_data['personal']['last_name'] = name_parts[-1]
-                continue
-
-        # Fallback: Headline (look for job titles in personal section)
-        if any(keyword in line.lower() for keyword in ['developer', 'engineer', 'manager', 'analyst', 'coordinator', 'specialist', 'director', 'lead', 'senior', 'junior']) and len(line) < 200:
-            if not parsed_data['personal'].get('headline'):
-                parsed_data['personal']['headline'] = line
-                continue
-
-        # Fallback: Email
-        if '@' in line and '.' in line and len(line) < 100:
-            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', line)
-            if email_match:
-                parsed_data['personal']['email'] = email_match.group()
-                continue
-
-        # Fallback: Phone
-        phone_match = re.search(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', line)
-        if phone_match:
-            parsed_data['personal']['phone'] = phone_match.group()
-            continue
-
-        # Fallback: Location (look for city, country patterns)
-        if any(keyword in line.lower() for keyword in ['japan', 'tokyo', 'california', 'san francisco', 'new york', 'london', 'paris', 'berlin', 'amsterdam', 'singapore', 'sydney', 'toronto', 'vancouver']) or re.search(r'[A-Z][a-z]+,\s*[A-Z][a-z]+', line):
-            if not parsed_data['personal'].get('location'):
-                parsed_data['personal']['location'] = line
-                continue
-
-    # Extract experience
-    experience_section = False
+    # Personal info, experience, education and skills are all read in one walk over the
+    # lines, each lowered and uppercased once; a section's *_done flag stands in for
+    # the `break` it had as a separate pass
+    experience_section = experience_done = False
     current_job = {}
+    education_section = education_done = False
+    current_edu = {}
+    seen_education = set()
+    skills_section = skills_done = False
+    skills = set()
 
-    for line in lines:
+    for i, line in enumerate(lines):
         line_lower = line.lower()
+        line_upper = line.upper()
 
-        # Start experience section
-        if 'experience' in line_lower or line.upper() == 'EXPERIENCE':
-            experience_section = True
-            continue
+        # Extract personal information
+        _parse_linkedin_personal_line(parsed_data['personal'], i, line, line_lower, line_upper)
 
-        # Stop at next section
-        if experience_section and any(keyword in line_lower for keyword in ['education', 'skills', 'projects']) or line.upper() in ['EDUCATION', 'SKILLS', 'PROJECTS']:
-            if current_job and current_job.get('title'):
-                parsed_data['experience'].append(current_job)
-            break
+        # Extract experience
+        if not experience_done:
+            # Start experience section
+            if 'experience' in line_lower or line_upper == 'EXPERIENCE':
+                experience_section = True
 
-        if experience_section:
-            # Skip empty lines and section headers
-            if not line.strip() or line.upper() in ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS']:
-                continue
+            # Stop at next section
+            elif experience_section and _EXPERIENCE_END_RE.search(line_lower) or line_upper in ['EDUCATION', 'SKILLS', 'PROJECTS']:
+                if current_job and current_job.get('title'):
+                    parsed_data['experience'].append(current_job)
+                experience_done = True
+
+            # Skip section headers
+            elif not experience_section or line_upper in _LINKEDIN_SECTION_HEADERS:
+                pass
 
             # Look for labeled experience info
-            if line.startswith('Title:'):
+            elif line.startswith('Title:'):
                 title = line.replace('Title:', '').strip()
                 if current_job and current_job.get('title'):
                     parsed_data['experience'].append(current_job)
                 current_job = {'title': title, 'company': '', 'dates': '', 'description': ''}
-                continue
 
-            if line.startswith('Company:'):
+            elif line.startswith('Company:'):
                 company = line.replace('Company:', '').strip()
                 if current_job and not current_job.get('company'):
                     current_job['company'] = company
-                continue
 
-            if line.startswith('Dates:'):
+            elif line.startswith('Dates:'):
                 dates = line.replace('Dates:', '').strip()
                 if current_job and not current_job.get('dates'):
                     current_job['dates'] = dates
-                continue
 
-            if line.startswith('Description:'):
+            elif line.startswith('Description:'):
                 description = line.replace('Description:', '').strip()
                 if current_job:
                     current_job['description'] = description
-                continue
 
             # Fallback: Job title patterns (more specific)
-            if any(keyword in line_lower for keyword in ['engineer', 'developer', 'manager', 'analyst', 'coordinator', 'specialist', 'director', 'lead', 'senior', 'junior', 'consultant', 'architect']):
+            elif _LINKEDIN_JOB_TITLE_RE.search(line_lower):
                 if current_job and current_job.get('title'):
                     parsed_data['experience'].append(current_job)
                 current_job = {'title': line, 'company': '', 'dates': '', 'description': ''}
-                continue
 
             # Fallback: Company patterns (look for company indicators)
-            if any(keyword in line_lower for keyword in ['inc', 'llc', 'corp', 'company', 'ltd', 'group', 'agency', 'startup', 'tech', 'systems', 'solutions']) or '•' in line:
+            elif _LINKEDIN_COMPANY_RE.search(line_lower) or '•' in line:
                 if current_job and not current_job.get('company'):
                     current_job['company'] = line
-                continue
 
             # Fallback: Date patterns
-            if re.search(r'\b(20\d{2}|19\d{2})\b', line) or re.search(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', line_lower):
+            elif _YEAR_RE.search(line) or _MONTH_RE.search(line_lower):
                 if current_job and not current_job.get('dates'):
                     current_job['dates'] = line
-                continue
 
             # Fallback: Description (longer text, but not bullet points)
-            if len(line) > 30 and current_job and not line.startswith('•') and not line.startswith('-'):
+            elif len(line) > 30 and current_job and not line.startswith('•') and not line.startswith('-'):
                 if current_job.get('description'):
                     current_job['description'] += ' ' + line
                 else:
                     current_job['description'] = line
 
-    # Add last job if it has a title
-    if current_job and current_job.get('title'):
-        parsed_data['experience'].append(current_job)
-
-    # Extract education
-    education_section = False
-    current_edu = {}
-    seen_education = set()
+        # Extract education
+        if not education_done:
+            # Start education section
+            if 'education' in line_lower or line_upper == 'EDUCATION':
+                education_section = True
 
-    for line in lines:
-        line_lower = line.lower()
+            # Stop at next section
+            elif education_section and _LINKEDIN_EDUCATION_END_RE.search(line_lower) or line_upper in ['EXPERIENCE', 'SKILLS', 'PROJECTS']:
+                if current_edu and current_edu.get('school'):
+                    edu_key = (current_edu.get('school', ''), current_edu.get('degree', ''))
+                    if edu_key not in seen_education:
+                        parsed_data['education'].append(current_edu)
+                        seen_education.add(edu_key)
+                education_done = True
 
-        # Start education section
-        if 'education' in line_lower or line.upper() == 'EDUCATION':
-            education_section = True
-            continue
-
-        # Stop at next section
-        if education_section and any(keyword in line_lower for keyword in ['experience', 'skills', 'projects']) or line.upper() in ['EXPERIENCE', 'SKILLS', 'PROJECTS']:
-            if current_edu and current_edu.get('school'):
-                edu_key = f"{current_edu.get('school', '')}-{current_edu.get('degree', '')}"
-                if edu_key not in seen_education:
-                    parsed_data['education'].append(current_edu)
-                    seen_education.add(edu_key)
-            break
-
-        if education_section:
-            # Skip empty lines and section headers
-            if not line.strip() or line.upper() in ['EDUCATION', 'EXPERIENCE', 'SKILLS', 'PROJECTS']:
-                continue
+            # Skip section headers
+            elif not education_section or line_upper in _LINKEDIN_SECTION_HEADERS:
+                pass
 
             # Look for labeled education info
-            if line.startswith('School:'):
+            elif line.startswith('School:'):
                 school = line.replace('School:', '').strip()
                 if current_edu and current_edu.get('school'):
-                    edu_key = f"{current_edu.get('school', '')}-{current_edu.get('degree', '')}"
+                    edu_key = (current_edu.get('school', ''), current_edu.get('degree', ''))
                     if edu_key not in seen_education:
                         parsed_data['education'].append(current_edu)
                         seen_education.add(edu_key)
                 current_edu = {'school': school, 'degree': '', 'year': ''}
-                continue
 
-            if line.startswith('Degree:'):
+            elif line.startswith('Degree:'):
                 degree = line.replace('Degree:', '').strip()
                 if current_edu and not current_edu.get('degree'):
                     current_edu['degree'] = degree
-                continue
 
-            if line.startswith('Year:'):
+            elif line.startswith('Year:'):
                 year = line.replace('Year:', '').strip()
                 if current_edu and not current_edu.get('year'):
                     current_edu['year'] = year
-                continue
 
             # Fallback: School patterns
-            if any(keyword in line_lower for keyword in ['university', 'college', 'institute', 'school']):
+            elif _LINKEDIN_SCHOOL_RE.search(line_lower):
                 if current_edu and current_edu.get('school'):
-                    edu_key = f"{current_edu.get('school', '')}-{current_edu.get('degree', '')}"
+                    edu_key = (current_edu.get('school', ''), current_edu.get('degree', ''))
                     if edu_key not in seen_education:
                         parsed_data['education'].append(current_edu)
                         seen_education.add(edu_key)
                 current_edu = {'school': line, 'degree': '', 'year': ''}
-                continue
 
             # Fallback: Degree patterns
-            if any(keyword in line_lower for keyword in ['bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'ma', 'degree', 'diploma', 'certificate']):
+            elif _LINKEDIN_DEGREE_RE.search(line_lower):
                 if current_edu and not current_edu.get('degree'):
                     current_edu['degree'] = line
-                continue
 
             # Fallback: Year patterns
-            year_match = re.search(r'\b(20\d{2}|19\d{2})\b', line)
-            if year_match and current_edu and not current_edu.get('year'):
-                current_edu['year'] = year_match.group()
+            else:
+                year_match = _YEAR_RE.search(line)
+                if year_match and current_edu and not current_edu.get('year'):
+                    current_edu['year'] = year_match.group()
+
+        # Extract skills
+        if not skills_done:
+            # Start skills section
+            if 'skills' in line_lower or line_upper == 'SKILLS':
+                skills_section = True
+
+            # Stop at next section
+            elif skills_section and _SKILLS_END_RE.search(line_lower) or line_upper in ['EXPERIENCE', 'EDUCATION', 'PROJECTS']:
+                skills_done = True
+
+            # Skip section headers
+            elif skills_section and line_upper not in _LINKEDIN_SECTION_HEADERS:
+                # Extract skills from line
+                skill_words = _SKILL_SPLIT_RE.split(line)
+                for word in skill_words:
+                    word = word.strip()
+                    if len(word) > 2 and len(word) < 30:
+                        skills.add(word)
+
+    # Add last job if it has a title
+    if current_job and current_job.get('title'):
+        parsed_data['experience'].append(current_job)
 
     # Add last education if not duplicate
     if current_edu and current_edu.get('school'):
-        edu_key = f"{current_edu.get('school', '')}-{current_edu.get('degree', '')}"
+        edu_key = (current_edu.get('school', ''), current_edu.get('degree', ''))
         if edu_key not in seen_education:
             parsed_data['education'].append(current_edu)
 
-    # Extract skills
-    skills_section = False
-    skills = set()
-
-    for line in lines:
-        line_lower = line.lower()
-
-        # Start skills section
-        if 'skills' in line_lower or line.upper() == 'SKILLS':
-            skills_section = True
-            continue
-
-        # Stop at next section
-        if skills_section and any(keyword in line_lower for keyword in ['experience', 'education', 'projects']) or line.upper() in ['EXPERIENCE', 'EDUCATION', 'PROJECTS']:
-            break
-
-        if skills_section:
-            # Skip empty lines and section headers
-            if not line.strip() or line.upper() in ['SKILLS', 'EXPERIENCE', 'EDUCATION', 'PROJECTS']:
-                continue
-
-            # Extract skills from line
-            skill_words = re.split(r'[,•·\-\n]', line)
-            for word in skill_words:
-                word = word.strip()
-                if len(word) > 2 and len(word) < 30:
-                    skills.add(word)
-
-    # Also look for skills throughout the text
-    tech_skills = [
-        'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
-        'react', 'vue', 'angular', 'node', 'express', 'django', 'flask', 'rails',
-        'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind',
-        'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github',
-        'linux', 'windows', 'macos', 'bash', 'powershell'
-    ]
-
-    text_lower = text.lower()
-    for skill in tech_skills:
-        if skill in text_lower:
-            skills.add(skill.title())
+    # Also look for skills throughout the text, as whole words
+    words = set(_SKILL_WORD_RE.findall(text.lower()))
+    skills.update(skill.title() for skill in _LINKEDIN_TECH_SKILLS & words)
 
     parsed_data['skills'] = list(skills)[:20]  # Limit to 20 skills
 
@@ -1048,17 +1290,8 @@ def apply_linkedin_enhancements(data, issues, page_content):
             if any(issue['type'] == 'company_name_extraction' and f'[{i}]' in issue['field'] for issue in issues):
                 
                 # Try to extract real company names from page content
-                company_patterns = [
-                    r'(AEON Corporation)',
-                    r'(Anchor Studio Corporation)', 
-                    r'(Gaba Corporation)',
-                    r'(Embassy Suites)',
-                    r'([A-Z][a-z]+ (?:Corporation|Company|Inc|LLC|Ltd))',
-                    r'([A-Z][a-z]+ [A-Z][a-z]+)(?=\s*·\s*(?:Permanent|Part-time|Full-time|Contract))'
-                ]
-                
-                for pattern in company_patterns:
-                    matches = re.findall(pattern, page_content, re.IGNORECASE)
+                for pattern in _COMPANY_NAME_RES:
+                    matches = pattern.findall(page_content)
                     if matches:
                         enhanced['work_experience'][i]['company'] = matches[0]
                         logger.info(f"🔧 Fixed company name for experience {i}: {matches[0]}")
@@ -1079,18 +1312,9 @@ def apply_linkedin_enhancements(data, issues, page_content):
     
     # Try to extract missing education from page content
     if not enhanced.get('education') or len(enhanced['education']) == 0:
-        education_patterns = [
-            r'(University of [A-Z][a-z]+)',
-            r'([A-Z][a-z]+ University)',
-            r'([A-Z][a-z]+ College)',
-            r'(Le Wagon)',
-            r'(Bachelor[\'s]*\s+(?:of|in)\s+[A-Z][a-z\s]+)',
-            r'(Master[\'s]*\s+(?:of|in)\s+[A-Z][a-z\s]+)'
-        ]
-        
         education_found = []
-        for pattern in education_patterns:
-            matches = re.findall(pattern, page_content, re.IGNORECASE)
+        for pattern in _EDUCATION_NAME_RES:
+            matches = pattern.findall(page_content)
             for match in matches:
                 if match not in education_found:
                     education_found.append(match)
@@ -1488,7 +1712,7 @@ def health_check():
     deps_ok = True
     try:
         pytesseract.get_tesseract_version()
-        if convert_from_path:
+        if convert_from_bytes:
             logger.info("✅ Poppler/pdf2image found")
         else:
             logger.warning("⚠️ Poppler/pdf2image not found")
@@ -1541,8 +1765,10 @@ if __name__ == '__main__':
         print(f"   Then run: ollama pull {ollama.model}")
         print("🔄 Server will work with rule-based fallbacks")
 
+    # Flask's built-in server is for local use; production runs under gunicorn (see README)
     app.run(
         host='0.0.0.0',
         port=PORT,
-        debug=True
+        debug=False,
+        threaded=True
     )